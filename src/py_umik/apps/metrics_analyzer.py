@@ -15,22 +15,107 @@ Year: 2025
 """
 
 import argparse
-import csv
 import logging
 import os
 import re
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import numpy as np
-from scipy.io import wavfile
+import soundfile as sf
 
 from py_umik.hardware.calibrator import HardwareCalibrator
+from py_umik.io.wav_reader import read_mono
 from py_umik.processing.audio_metrics import AudioMetrics
 
 logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 logger = logging.getLogger(__name__)
 
+# Recording start time embedded in a filename (YYYY-MM-DD HH:MM:SS, with T/_ and ./: variants).
+_TS_RE = re.compile(r"(\d{4}-\d{2}-\d{2}[\sT_]\d{2}[:\.]\d{2}[:\.]\d{2})")
+
+# Fixed-point precision of each numeric CSV column; any other column is written as-is.
+_CSV_FORMATS = {"time_sec": "%.3f", "rms": "%.6f", "dbfs": "%.2f", "lufs": "%.2f", "flux": "%.2f", "dbspl": "%.2f"}
+
+
+def compute_metric_columns(
+    metrics_engine: AudioMetrics,
+    audio_data: np.ndarray,
+    sample_rate: int,
+    chunk_size: int,
+    sensitivity: float | None = None,
+    reference: float = 94.0,
+) -> dict[str, np.ndarray | list]:
+    """
+    Calculates the per-chunk metrics of a whole signal in vectorized passes.
+
+    Shared by the single-file analyzer and the batch analysis script, so both
+    report the same numbers for the same file.
+
+    :param metrics_engine: An AudioMetrics instance for the signal's sample rate.
+    :param audio_data: The mono float32 signal.
+    :param sample_rate: The sample rate of the signal.
+    :param chunk_size: The number of samples per analysis chunk.
+    :param sensitivity: The microphone sensitivity in dBFS (optional, for dBSPL).
+    :param reference: The reference pressure level in dB (default 94.0).
+    :return: Columns time_sec, rms, dbfs, lufs, flux and dbspl (empty strings when uncalibrated).
+    """
+    lufs_window = int(sample_rate * 1.0)  # 1s window for valid LUFS
+    total_chunks = len(audio_data) // chunk_size
+
+    # --- Vectorized Level Metrics ---
+    # Frame the signal as (total_chunks, chunk_size) and reduce every row at once
+    # instead of calling the per-chunk metric methods inside the loop.
+    frames = audio_data[: total_chunks * chunk_size].reshape(total_chunks, chunk_size)
+    rms_series = np.sqrt(np.mean(np.square(frames), axis=1))
+    dbfs_arr = metrics_engine.rms_to_dBFS(rms_series)
+
+    dbspl_arr: np.ndarray | list = [""] * total_chunks
+    if sensitivity is not None:
+        dbspl_arr = metrics_engine.dBSPL(dbfs_arr, sensitivity, reference)
+
+    # --- Sliding-Window LUFS ---
+    # K-weight the whole file once and integrate its power with a cumulative sum,
+    # so the mean square of each 1s look-back window costs two lookups.
+    k_power = np.square(metrics_engine.k_weighting(audio_data), dtype=np.float64)
+    k_cumsum = np.concatenate(([0.0], np.cumsum(k_power)))
+    ends = np.arange(1, total_chunks + 1) * chunk_size
+    starts = np.maximum(0, ends - lufs_window)
+    lufs_arr = metrics_engine.mean_square_to_lufs((k_cumsum[ends] - k_cumsum[starts]) / (ends - starts))
+    # Not enough history (at least 40% of the window) for a valid measurement.
+    lufs_arr[(ends - starts) < lufs_window * 0.4] = -70.0
+
+    # --- Spectral Flux ---
+    # One onset envelope for the whole file, reduced to the peak of each chunk.
+    flux_arr = metrics_engine.flux_series(audio_data, sample_rate, chunk_size)
+
+    return {
+        "time_sec": ends / sample_rate,
+        "rms": rms_series,
+        "dbfs": dbfs_arr,
+        "lufs": lufs_arr,
+        "flux": flux_arr,
+        "dbspl": dbspl_arr,
+    }
+
+
+def format_csv_rows(columns: dict) -> list[str]:
+    """
+    Formats metric columns into CSV data lines (without the header).
+
+    Numeric columns are rounded by a single %-format per row instead of
+    np.round + csv.writer.
+
+    :param columns: Column name to numpy array (or list) of equal length.
+    :return: One comma-separated line per row.
+    """
+    row_format = ",".join(
+        _CSV_FORMATS.get(name, "%s") if isinstance(values, np.ndarray) and values.dtype.kind == "f" else "%s"
+        for name, values in columns.items()
+    )
+    values = [col.tolist() if isinstance(col, np.ndarray) else col for col in columns.values()]
+    return [row_format % row for row in zip(*values, strict=True)]
+
 
 class MetricsAnalyzer:
     """
@@ -73,7 +158,11 @@ class MetricsAnalyzer:
             sys.exit(1)
 
         try:
-            sample_rate, data = wavfile.read(path)
+            # libsndfile decodes and normalizes to float32 in a single pass,
+            # so no integer copy of the file is ever held in memory.
+            with sf.SoundFile(path) as wav:
+                sample_rate = wav.samplerate
+                data = wav.read(dtype="float32") if wav.channels == 1 else read_mono(wav)
             # Handle empty files
             if data.size == 0:
                 logger.error("WAV file contains no data.")
@@ -82,16 +171,6 @@ class MetricsAnalyzer:
             logger.error(f"Error reading WAV file: {e}")
             sys.exit(1)
 
-        # Mix to Mono
-        if len(data.shape) > 1:
-            data = np.mean(data, axis=1)
-
-        # Normalize Bit Depth
-        if data.dtype == np.int16:
-            data = data.astype(np.float32) / 32768.0
-        elif data.dtype == np.int32:
-            data = data.astype(np.float32) / 2147483648.0
-
         return sample_rate, data
 
     def _get_start_time(self, manual_str: str | None = None) -> datetime | None:
@@ -103,7 +182,7 @@ class MetricsAnalyzer:
                 logger.warning("Invalid manual start time format. Expected ISO.")
 
         # Try Filename Parsing (YYYY-MM-DD HH:MM:SS)
-        match = re.search(r"(\d{4}-\d{2}-\d{2}[\sT_]\d{2}[:\.]\d{2}[:\.]\d{2})", self.filename)
+        match = _TS_RE.search(self.filename)
         if match:
             dt_str = match.group(1).replace("_", " ").replace("T", " ").replace(".", ":")
             try:
@@ -134,99 +213,64 @@ class MetricsAnalyzer:
         if chunk_size == 0:
             chunk_size = 1  # prevent divide by zero for tiny files
 
-        lufs_window = int(self.sample_rate * 1.0)  # 1s window for valid LUFS
         total_chunks = len(self.audio_data) // chunk_size
 
-        results = []
-
-        # --- Processing Loop ---
-        for i in range(total_chunks):
-            start = i * chunk_size
-            end = start + chunk_size
-            chunk = self.audio_data[start:end]
-            rel_time = end / self.sample_rate
-
-            # 1. Timestamp
-            abs_time_str = ""
-            if start_dt:
-                curr_dt = start_dt + timedelta(seconds=rel_time)
-                abs_time_str = curr_dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-
-            # 2. Basic Metrics
-            rms = self.metrics_engine.rms(chunk)
-            dbfs = self.metrics_engine.dBFS(chunk)
-            flux = self.metrics_engine.flux(chunk, self.sample_rate)
-
-            # 3. LUFS (Sliding Window)
-            lufs_start = max(0, end - lufs_window)
-            lufs_chunk = self.audio_data[lufs_start:end]
-            lufs = -70.0
-            if len(lufs_chunk) >= lufs_window * 0.4:
-                try:
-                    lufs = self.metrics_engine.lufs(lufs_chunk)
-                except ValueError:
-                    pass
-
-            # 4. dBSPL
-            dbspl = None
-            if self.sensitivity is not None:
-                dbspl = self.metrics_engine.dBSPL(dbfs, self.sensitivity, self.reference)
-
-            # Store Row
-            results.append(
-                {
-                    "time_sec": round(rel_time, 3),
-                    "timestamp": abs_time_str,
-                    "rms": round(rms, 6),
-                    "dbfs": round(dbfs, 2),
-                    "lufs": round(lufs, 2),
-                    "flux": round(flux, 2),
-                    "dbspl": round(dbspl, 2) if dbspl is not None else "",
-                }
-            )
-
-            if i % 100 == 0:
-                print(f"\rProcessing: {int((i / total_chunks) * 100)}%", end="")
-
-        print("\rProcessing: 100% Complete.   \n")
-
-        self._save_csv(results, output_csv)
-        self._print_summary(results)
-
-    def _save_csv(self, data: list, path: str):
-        if not data:
+        metrics = compute_metric_columns(
+            self.metrics_engine, self.audio_data, self.sample_rate, chunk_size, self.sensitivity, self.reference
+        )
+        ends = np.arange(1, total_chunks + 1) * chunk_size
+
+        # --- Absolute Timestamps ---
+        # Offset the start time by whole microseconds and format every row in one call.
+        abs_times: np.ndarray | list[str]
+        if start_dt:
+            offsets_us = (ends * 1_000_000 // self.sample_rate).astype("timedelta64[us]")
+            abs_dt = np.datetime64(start_dt.replace(tzinfo=None), "us") + offsets_us
+            abs_times = np.char.replace(np.datetime_as_string(abs_dt, unit="ms"), "T", " ")
+        else:
+            abs_times = [""] * total_chunks
+
+        logger.info(f"Processed {total_chunks} chunks.")
+
+        # --- Output Columns (SoA) ---
+        columns = {"time_sec": metrics.pop("time_sec"), "timestamp": abs_times, **metrics}
+
+        self._save_csv(columns, total_chunks, output_csv)
+        self._print_summary(columns, total_chunks)
+
+    def _save_csv(self, columns: dict, num_rows: int, path: str):
+        if num_rows == 0:
             logger.warning("No data generated.")
             return
 
-        keys = data[0].keys()
-        with open(path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(data)
+        lines = [",".join(columns.keys())]
+        lines.extend(format_csv_rows(columns))
+
+        # A 1 MiB buffer turns the output into a handful of large syscalls.
+        with open(path, "w", newline="", buffering=1 << 20) as f:
+            f.write("\r\n".join(lines) + "\r\n")
         logger.info(f"✅ Results saved to: {path}")
 
-    def _print_summary(self, results: list):
-        if not results:
+    def _print_summary(self, columns: dict, num_rows: int):
+        if num_rows == 0:
             logger.warning("Summary: No results to display.")
             return
 
         logger.info("=" * 40)
         logger.info("📈 ANALYSIS SUMMARY")
         logger.info("=" * 40)
-        max_dbfs = max(r["dbfs"] for r in results)
-        max_lufs = max(r["lufs"] for r in results)
-        max_flux = max(r["flux"] for r in results)
+        max_dbfs = float(columns["dbfs"].max())
+        max_lufs = float(columns["lufs"].max())
+        max_flux = float(columns["flux"].max())
 
         logger.info(f"Peak Level:    {max_dbfs:.2f} dBFS")
         logger.info(f"Max Loudness:  {max_lufs:.2f} LUFS")
         logger.info(f"Max Flux:      {max_flux:.2f}")
 
-        if self.sensitivity:
-            # Handle potential empty strings in dBSPL if uncalibrated data mixed in (unlikely but safe)
-            spl_values = [r["dbspl"] for r in results if r["dbspl"] != ""]
-            if spl_values:
-                max_spl = max(spl_values)
-                logger.info(f"Max SPL:       {max_spl:.2f} dBSPL")
+        if self.sensitivity is not None:
+            # dBSPL is dBFS shifted by a constant, so its peak follows from the dBFS peak.
+            max_spl = self.metrics_engine.dBSPL(max_dbfs, self.sensitivity, self.reference)
+            logger.info(f"Max SPL:       {max_spl:.2f} dBSPL")
         logger.info("=" * 40)
 
 
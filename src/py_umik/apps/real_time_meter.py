@@ -13,12 +13,13 @@ Year: 2025
 
 import logging
 import sys
-from datetime import datetime
+from typing import NamedTuple
 
 import numpy as np
 
 from py_umik.core.base_app import BaseApp
 from py_umik.core.config import AppArgs, AppConfig
+from py_umik.core.datetime_stamp import DatetimeStamp
 from py_umik.core.interfaces import AudioSink
 from py_umik.core.pipeline import AudioPipeline
 from py_umik.hardware.calibrator_adapter import HardwareCalibratorAdapter
@@ -32,6 +33,29 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+class MeterConstants(NamedTuple):
+    """Snapshot of the configuration values the sink reads for every interval."""
+
+    sample_rate: float
+    sensitivity_dbfs: float | None
+    reference_dbspl: float | None
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> "MeterConstants":
+        """
+        Builds the snapshot, keeping sensitivity values only if calibration is active.
+
+        :param config: The validated application configuration.
+        :return: The frozen constants.
+        """
+        calibrated = config.audio_calibrator is not None and config.sensitivity_dbfs is not None
+        return cls(
+            sample_rate=config.sample_rate,
+            sensitivity_dbfs=config.sensitivity_dbfs if calibrated else None,
+            reference_dbspl=config.reference_dbspl if calibrated else None,
+        )
+
+
 class AudioMetricsAudioSink(AudioSink):
     """
     A sink component that accumulates audio and calculates metrics
@@ -42,8 +66,10 @@ class AudioMetricsAudioSink(AudioSink):
         """
         Initializes the metrics sink with buffering logic.
         """
-        self._config = config
+        self._consts = MeterConstants.from_config(config)
         self._audio_metrics = AudioMetrics(sample_rate=config.sample_rate)
+        # Bound once: called for every chunk on the consumer thread.
+        self._stream_energy = self._audio_metrics.stream_energy
 
         # Buffering Config
         self._interval_seconds = settings.METRICS.INTERVAL_SECONDS if hasattr(settings, "METRICS") else 3
@@ -53,67 +79,109 @@ class AudioMetricsAudioSink(AudioSink):
 
         if self._interval_seconds > 0:
             self._target_samples = int(self._interval_seconds * config.sample_rate)
-            self._accumulated_samples = 0
-            self._audio_buffer: list[np.ndarray] = []
+            # Preallocated window: chunks are copied in place, so no per-interval concatenation.
+            self._audio_buffer = np.empty(self._target_samples, dtype=np.float32)
+            self._write_index = 0
+            # Running energy of the current window, updated as chunks arrive.
+            self._sum_squares = 0.0
+            self._k_sum_squares = 0.0
             logger.info(f"Metrics Sink: Buffered Mode ({self._interval_seconds}s / {self._target_samples} samples).")
         else:
             self._target_samples = 0
             logger.info("Metrics Sink: Immediate Mode (Per-Chunk).")
 
-    def handle_audio(self, audio_chunk: np.ndarray, timestamp: datetime) -> None:
+    def handle_audio(self, audio_chunk: np.ndarray, timestamp: int) -> None:
         """
         Buffers audio chunks. When full, calculates and logs metrics.
         """
         try:
             # 1. Immediate Mode
-            if self._target_samples <= 0:
-                self._process_and_log(audio_chunk, timestamp)
+            target_samples = self._target_samples
+            if target_samples <= 0:
+                self._process_and_log(audio_chunk, timestamp, *self._stream_energy(audio_chunk))
                 return
 
-            # 2. Windowed Mode
-            self._audio_buffer.append(audio_chunk)
-            self._accumulated_samples += len(audio_chunk)
+            # 2. Windowed Mode (state is kept in locals and written back once per chunk)
+            stream_energy = self._stream_energy
+            audio_buffer = self._audio_buffer
+            write_index = self._write_index
+            sum_squares = self._sum_squares
+            k_sum_squares = self._k_sum_squares
+            chunk_len = len(audio_chunk)
+
+            offset = 0
+            while offset < chunk_len:
+                # Copy as much as fits; any remainder spills into the next window.
+                n = min(chunk_len - offset, target_samples - write_index)
+                piece = audio_chunk[offset : offset + n]
+                audio_buffer[write_index : write_index + n] = piece
+                piece_sum_squares, piece_k_sum_squares = stream_energy(piece)
+                sum_squares += piece_sum_squares
+                k_sum_squares += piece_k_sum_squares
+                write_index += n
+                offset += n
+
+                if write_index == target_samples:
+                    self._process_and_log(audio_buffer, timestamp, sum_squares, k_sum_squares)
+                    write_index = 0
+                    sum_squares = 0.0
+                    k_sum_squares = 0.0
+
+            self._write_index = write_index
+            self._sum_squares = sum_squares
+            self._k_sum_squares = k_sum_squares
 
-            if self._accumulated_samples >= self._target_samples:
-                # Combine & Process
-                full_block = np.concatenate(self._audio_buffer)
-                self._process_and_log(full_block, datetime.now())
+        except Exception as e:
+            logger.error("Error in AudioMetricsAudioSink: %s", e, exc_info=True)
 
-                # Reset
-                self._audio_buffer = []
-                self._accumulated_samples = 0
+    def _process_and_log(self, audio_data: np.ndarray, timestamp: int, sum_squares: float, k_sum_squares: float):
+        """
+        Calculates core metrics and calls the display method.
 
-        except Exception as e:
-            logger.error(f"Sink Error: {e}", exc_info=True)
+        RMS and LUFS are finalized from the energy accumulated while the window
+        was filled, so only the spectral flux needs to read the audio again.
 
-    def _process_and_log(self, audio_data: np.ndarray, timestamp: datetime):
-        """Calculates core metrics and calls the display method."""
+        :param audio_data: The audio samples of the interval.
+        :param timestamp: Capture time (ns since epoch) of the chunk that completed the interval.
+        :param sum_squares: The sum of squares of the raw samples.
+        :param k_sum_squares: The sum of squares of the K-weighted samples.
+        """
+        # The metrics are only ever logged; skip the flux STFT and formatting if they would be dropped.
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
         # Calculate Base Metrics
-        rms = self._audio_metrics.rms(audio_data)
-        dbfs = self._audio_metrics.dBFS(audio_data)
-        flux = self._audio_metrics.flux(audio_data, self._config.sample_rate)
-        lufs = self._audio_metrics.lufs(audio_data)
-
-        metrics_data = {
-            "measured_at": timestamp,
-            "interval_s": (len(audio_data) / self._config.sample_rate),
-            "rms": rms,
-            "flux": flux,
-            "dBFS": dbfs,
-            "LUFS": lufs,
-        }
-
-        # Calculate dBSPL (if calibrated)
-        if self._config.audio_calibrator and self._config.sensitivity_dbfs is not None:
-            dbspl = self._audio_metrics.dBSPL(
-                dbfs_level=dbfs,
-                sensitivity_dbfs=self._config.sensitivity_dbfs,
-                reference_dbspl=self._config.reference_dbspl,
+        rms = float(np.sqrt(sum_squares / len(audio_data)))
+        dbfs = self._audio_metrics.rms_to_dBFS(rms)
+        flux = self._audio_metrics.flux(audio_data, self._consts.sample_rate)
+        lufs = self._audio_metrics.mean_square_to_lufs(k_sum_squares / len(audio_data))
+        measured_at = DatetimeStamp.format(timestamp)
+        interval_s = len(audio_data) / self._consts.sample_rate
+
+        if self._consts.sensitivity_dbfs is None or self._consts.reference_dbspl is None:
+            logger.info(
+                "[measured_at: %s] interval_s=%.2f rms=%.4f flux=%.4f dBFS=%.2f LUFS=%.2f [audio-metrics]",
+                measured_at,
+                interval_s,
+                rms,
+                flux,
+                dbfs,
+                lufs,
             )
-            metrics_data["dBSPL"] = dbspl
-
-        self._audio_metrics.show_metrics(**metrics_data)
+            return
+
+        # Calculate dBSPL (calibrated)
+        dbspl = self._audio_metrics.dBSPL(dbfs, self._consts.sensitivity_dbfs, self._consts.reference_dbspl)
+        logger.info(
+            "[measured_at: %s] interval_s=%.2f rms=%.4f flux=%.4f dBFS=%.2f LUFS=%.2f dBSPL=%.2f [audio-metrics]",
+            measured_at,
+            interval_s,
+            rms,
+            flux,
+            dbfs,
+            lufs,
+            dbspl,
+        )
 
 
 class DecibelMeterApp(BaseApp):
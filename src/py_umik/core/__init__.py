@@ -6,6 +6,7 @@ GitHub: https://github.com/danielfcollier
 Year: 2025
 """
 
+from .audio_queue import AudioQueue
 from .base_app import BaseApp
 from .config import AppArgs, AppConfig
 from .consumer_thread import ConsumerThread
@@ -19,6 +20,7 @@ __all__ = [
     "AppConfig",
     "AppArgs",
     "AudioPipeline",
+    "AudioQueue",
     "AudioTransformer",
     "AudioSink",
     "ThreadApp",
@@ -0,0 +1,91 @@
+"""
+Implements the bounded hand-off queue between the audio listener and consumer.
+
+The audio path has exactly one producer and one consumer, so a plain deque
+(whose append/popleft are atomic in CPython) plus an Event for wake-ups is
+enough; no per-operation lock or Condition is involved.
+
+Author: Daniel Collier
+GitHub: https://github.com/danielfcollier
+Year: 2025
+"""
+
+import logging
+import queue
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class AudioQueue:
+    """
+    A bounded single-producer / single-consumer queue of audio items.
+
+    Mirrors the subset of the `queue.Queue` API used by the listener and
+    consumer threads (`put_nowait` and `get`). When the queue is full, the
+    oldest item is dropped so the consumer always catches up with the most
+    recent audio.
+
+    The data path takes no lock: `deque.append` and `deque.popleft` are
+    atomic, so the producer and consumer never contend on the items. The
+    event is only touched to wake a consumer that found the queue empty.
+    """
+
+    def __init__(self, maxlen: int):
+        """
+        Initializes the queue.
+
+        :param maxlen: The maximum number of queued items before the oldest is dropped.
+        """
+        self._items: deque = deque(maxlen=maxlen)
+        self._maxlen = maxlen
+        self._ready = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, item):
+        """
+        Appends an item without blocking, evicting the oldest one if the queue is full.
+
+        :param item: The item to enqueue (e.g., an (audio_chunk, timestamp) tuple).
+        """
+        if len(self._items) == self._maxlen:
+            logger.warning("Consumer queue is full! Dropping oldest audio chunk to maintain real-time monitoring.")
+        self._items.append(item)
+        # Event.set() takes the event's lock; skip it while the consumer has not consumed the last wake-up.
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def get_nowait(self):
+        """
+        Removes and returns the oldest item without waiting.
+
+        :return: The oldest queued item.
+        :raises queue.Empty: If the queue is empty.
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def get(self, timeout: float | None = None):
+        """
+        Removes and returns the oldest item, waiting up to `timeout` seconds for one.
+
+        :param timeout: Maximum seconds to wait. None waits indefinitely.
+        :return: The oldest queued item.
+        :raises queue.Empty: If no item arrived within the timeout.
+        """
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+
+            if not self._ready.wait(timeout):
+                raise queue.Empty
+            # Clear before re-checking the deque, so an item appended after this
+            # point sets the event again and is never missed.
+            self._ready.clear()
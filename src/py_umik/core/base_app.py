@@ -15,6 +15,7 @@ import threading
 
 from ..hardware.config import HardwareConfig
 from ..settings import get_settings
+from .buffer_pool import AudioBufferPool
 from .consumer_thread import ConsumerThread
 from .listener_thread import ListenerThread
 from .pipeline import AudioPipeline
@@ -46,10 +47,17 @@ class BaseApp(ThreadApp):
                              necessary processors (e.g., HardwareCalibrator) and sinks
                              (e.g., Recorder, Metrics).
         """
-        # Initialize the parent ThreadApp (creates queue, lock, stop_event, thread list).
+        # Initialize the parent ThreadApp (creates the AudioQueue, lock, stop_event, thread list).
         super().__init__()
         logger.debug("BaseApp initializing...")
 
+        # Block buffers recycled between the listener and the consumer.
+        self._buffer_pool = AudioBufferPool(
+            block_size=audio_config.block_size,
+            dtype=audio_config.dtype,
+            size=settings.AUDIO_BUFFER_POOL_SIZE,
+        )
+
         # Store the essential configuration and the processing pipeline.
         self._audio_config: HardwareConfig = audio_config
         self._pipeline: AudioPipeline = pipeline
@@ -70,8 +78,11 @@ class BaseApp(ThreadApp):
             audio_device_config=self._audio_config,
             audio_queue=self._queue,
             stop_event=self._stop_event,
+            buffer_pool=self._buffer_pool,
         )
 
+        # This thread only supervises the stream; listener_core is applied by the
+        # listener to PortAudio's callback thread, where capture actually runs.
         listener_thread = threading.Thread(
             target=self._thread_guard(listener.run),
             name="ListenerThread",
@@ -88,10 +99,12 @@ class BaseApp(ThreadApp):
             stop_event=self._stop_event,
             pipeline=self._pipeline,
             consumer_queue_timeout_seconds=settings.CONSUMER_QUEUE_TIMEOUT_SECONDS,
+            buffer_pool=self._buffer_pool,
+            max_batch_chunks=settings.CONSUMER_MAX_BATCH_CHUNKS,
         )
 
         consumer_thread = threading.Thread(
-            target=self._thread_guard(consumer.run),
+            target=self._thread_guard(self._pin_to_core(consumer.run, self._audio_config.consumer_core)),
             name="ConsumerThread",
         )
         self._threads.append(consumer_thread)
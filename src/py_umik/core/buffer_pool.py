@@ -0,0 +1,63 @@
+"""
+Implements a pool of reusable audio block buffers.
+
+The listener fills one buffer per captured block and the consumer hands it back
+once the pipeline is done with it, so the steady state allocates no new arrays.
+
+Author: Daniel Collier
+GitHub: https://github.com/danielfcollier
+Year: 2025
+"""
+
+import logging
+from collections import deque
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AudioBufferPool:
+    """
+    A fixed-size free list of preallocated 1-D audio buffers.
+
+    `acquire` and `release` are called from different threads; both only use
+    deque append/pop operations, which are atomic in CPython.
+    """
+
+    def __init__(self, block_size: int, dtype: str, size: int):
+        """
+        Preallocates the pool.
+
+        :param block_size: Number of samples per buffer.
+        :param dtype: Sample data type of the buffers (e.g., 'float32').
+        :param size: Number of buffers kept in the pool.
+        """
+        self._block_size = block_size
+        self._dtype = np.dtype(dtype)
+        self._free: deque[np.ndarray] = deque(
+            (np.empty(block_size, dtype=self._dtype) for _ in range(size)), maxlen=size
+        )
+
+    def acquire(self) -> np.ndarray:
+        """
+        Takes a buffer from the pool, allocating a new one if the pool is exhausted
+        (e.g., while the consumer is lagging behind).
+
+        :return: A 1-D numpy array of `block_size` samples with undefined contents.
+        """
+        try:
+            return self._free.pop()
+        except IndexError:
+            logger.debug("Audio buffer pool exhausted, allocating a new buffer.")
+            return np.empty(self._block_size, dtype=self._dtype)
+
+    def release(self, buffer: np.ndarray):
+        """
+        Returns a buffer to the pool. Buffers of a different shape or dtype, or
+        beyond the pool size, are left to the garbage collector.
+
+        :param buffer: A buffer previously obtained from `acquire`.
+        """
+        if buffer.shape == (self._block_size,) and buffer.dtype == self._dtype:
+            self._free.append(buffer)
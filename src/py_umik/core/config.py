@@ -13,9 +13,11 @@ Year: 2025
 
 import argparse
 import logging
-import math
 import os
 import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache, partial
 
 from ..hardware.calibrator import HardwareCalibrator
 from ..hardware.selector import HardwareNotFound, HardwareSelector
@@ -25,27 +27,49 @@ settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# Buffer settings read once at import; call refresh_settings() after changing them at runtime.
+_MIN_BUFFER_SECONDS = settings.AUDIO.MIN_BUFFER_SECONDS
+_LUFS_WINDOW_SECONDS = settings.AUDIO.LUFS_WINDOW_SECONDS
+_DEFAULT_BUFFER_SECONDS = settings.AUDIO.BUFFER_SECONDS
 
+
+def refresh_settings():
+    """
+    Re-reads the buffer settings cached by this module.
+
+    Needed only when `settings.AUDIO` is modified after import (e.g., by tests),
+    since argument parsing and validation use the module-level copies.
+    """
+    global _MIN_BUFFER_SECONDS, _LUFS_WINDOW_SECONDS, _DEFAULT_BUFFER_SECONDS
+    _MIN_BUFFER_SECONDS = settings.AUDIO.MIN_BUFFER_SECONDS
+    _LUFS_WINDOW_SECONDS = settings.AUDIO.LUFS_WINDOW_SECONDS
+    _DEFAULT_BUFFER_SECONDS = settings.AUDIO.BUFFER_SECONDS
+
+
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """
     Holds the validated and processed configuration settings for the audio application.
-    """
 
-    def __init__(self, audio_device: HardwareSelector, sample_rate: float, buffer_seconds: float):
-        """
-        Initializes the configuration object.
+    Immutable once built by :meth:`AppArgs.validate_args`; slots keep attribute reads
+    from the worker threads off the instance ``__dict__``.
 
-        :param audio_device: The selected HardwareSelector instance.
-        :param sample_rate: The final sample rate to be used (native or default).
-        :param buffer_seconds: The validated and adjusted buffer duration in seconds.
-        """
-        self.audio_device: HardwareSelector = audio_device
-        self.sample_rate: float = sample_rate
-        self.buffer_seconds: float = buffer_seconds
-        self.audio_calibrator: HardwareCalibrator | None = None
-        self.sensitivity_dbfs: float | None = None
-        self.reference_dbspl: float | None = None
-        self.num_taps: int | None = None
+    :param audio_device: The selected HardwareSelector instance.
+    :param sample_rate: The final sample rate to be used (native or default).
+    :param buffer_seconds: The validated and adjusted buffer duration in seconds.
+    :param audio_calibrator: Factory for the deferred HardwareCalibrator, or None when uncalibrated.
+    :param sensitivity_dbfs: Microphone sensitivity from the calibration file, if any.
+    :param reference_dbspl: Reference SPL from the calibration file, if any.
+    :param num_taps: FIR filter length used for calibration, if any.
+    """
+
+    audio_device: HardwareSelector
+    sample_rate: float
+    buffer_seconds: float
+    audio_calibrator: Callable[[], HardwareCalibrator] | None = None
+    sensitivity_dbfs: float | None = None
+    reference_dbspl: float | None = None
+    num_taps: int | None = None
 
 
 class AppArgs:
@@ -78,12 +102,12 @@ class AppArgs:
             "-b",
             "--buffer-seconds",
             type=float,
-            default=settings.AUDIO.BUFFER_SECONDS,
+            default=_DEFAULT_BUFFER_SECONDS,
             help=(
                 f"Duration of audio buffers in seconds. "
-                f"Minimum: {settings.AUDIO.MIN_BUFFER_SECONDS}s. Will be rounded up to a multiple "
-                f"of LUFS window ({settings.AUDIO.LUFS_WINDOW_SECONDS}s). "
-                f"Default: {settings.AUDIO.BUFFER_SECONDS}s."
+                f"Minimum: {_MIN_BUFFER_SECONDS}s. Will be rounded up to a multiple "
+                f"of LUFS window ({_LUFS_WINDOW_SECONDS}s). "
+                f"Default: {_DEFAULT_BUFFER_SECONDS}s."
             ),
         )
         parser.add_argument(
@@ -122,11 +146,16 @@ class AppArgs:
         return parser
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_args() -> argparse.Namespace:
         """
         Defines and parses command-line arguments using argparse.
         This remains for backward compatibility with apps that don't need custom args.
 
+        The result is cached, so `sys.argv` is parsed only once per process and
+        every caller shares the same Namespace. `get_parser` is not cached, as
+        callers extend the returned parser with their own arguments.
+
         :return: An argparse.Namespace object containing the parsed arguments.
         """
         parser = AppArgs.get_parser()
@@ -141,9 +170,11 @@ class AppArgs:
         - Resolves calibration file from Arg or Env Var.
         - Ensures buffer_seconds meets the minimum and is a multiple of the LUFS window.
         - Auto-detects UMIK-1 if calibration file is present but device ID is missing.
+          The lookup is cached: call `HardwareSelector.invalidate_device_cache()` before
+          validating again after devices were (un)plugged.
         - Selects the audio device (default or specified ID).
         - Determines the final sample rate (uses native rate if calibrating).
-        - Initializes the HardwareCalibrator and extracts sensitivity if a calibration file is provided.
+        - Prepares a HardwareCalibrator factory and extracts sensitivity if a calibration file is provided.
         - Catches device selection errors (HardwareNotFound) and exits the application.
 
         :param args: The argparse.Namespace object containing parsed arguments from get_args().
@@ -153,29 +184,39 @@ class AppArgs:
         """
         logger.info("Validating command-line arguments...")
 
+        # Read each argument once; only these locals are used below.
+        cal_file = args.calibration_file
+        is_default = bool(args.default)
+        device_id = args.device_id
+
         # --- 1. Resolve Calibration File (Arg > Env) ---
-        if args.calibration_file is None and not args.default:
-            env_cal_file = os.environ.get("CALIBRATION_FILE")
-            if env_cal_file:
-                logger.info(f"Found CALIBRATION_FILE env var: {env_cal_file}")
-                args.calibration_file = env_cal_file
-        elif args.default and args.calibration_file is None:
-            logger.info("Flag --default set. Ignoring CALIBRATION_FILE environment variable.")
+        if cal_file is None:
+            if is_default:
+                logger.info("Flag --default set. Ignoring CALIBRATION_FILE environment variable.")
+            else:
+                env_cal_file = os.environ.get("CALIBRATION_FILE")
+                if env_cal_file:
+                    logger.info(f"Found CALIBRATION_FILE env var: {env_cal_file}")
+                    cal_file = env_cal_file
+        is_calibrated = bool(cal_file)
 
         # --- 2. Auto-Detect UMIK-1 if needed ---
-        if args.calibration_file and args.device_id is None and not args.default:
+        if is_calibrated and device_id is None and not is_default:
             logger.info("Calibration file active. Attempting to auto-detect 'UMIK-1'...")
             umik_id = HardwareSelector.find_device_by_name("UMIK-1")
             if umik_id is not None:
                 logger.info(f"✨ Auto-detected UMIK-1 at Device ID {umik_id}")
-                args.device_id = umik_id
+                device_id = umik_id
             else:
                 logger.warning("⚠️ Could not find a device named 'UMIK-1'. Will attempt to use system default.")
 
         # --- 3. Buffer Validation ---
         buffer_seconds = float(args.buffer_seconds)
-        min_buf = settings.AUDIO.MIN_BUFFER_SECONDS
-        lufs_window = settings.AUDIO.LUFS_WINDOW_SECONDS
+        min_buf = _MIN_BUFFER_SECONDS
+        lufs_window = _LUFS_WINDOW_SECONDS
+        # Compare in whole milliseconds so float noise (e.g. 6.0000000001 % 3.0) cannot trigger a resize.
+        buffer_ms = round(buffer_seconds * 1000)
+        window_ms = round(lufs_window * 1000)
 
         if buffer_seconds < min_buf:
             logger.warning(
@@ -183,8 +224,8 @@ class AppArgs:
                 f"Adjusting buffer size to {min_buf:.1f}s."
             )
             buffer_seconds = min_buf
-        elif buffer_seconds % lufs_window != 0:
-            new_buffer = math.ceil(buffer_seconds / lufs_window) * lufs_window
+        elif buffer_ms % window_ms:
+            new_buffer = -(-buffer_ms // window_ms) * window_ms / 1000
             logger.warning(
                 f"Adjusting buffer size from {buffer_seconds:.2f}s to {new_buffer:.1f}s to be an even multiple of "
                 f"the LUFS window ({lufs_window:.1f}s)."
@@ -193,7 +234,7 @@ class AppArgs:
 
         # --- 4. Hardware Selection ---
         try:
-            target_id = None if args.default else args.device_id
+            target_id = None if is_default else device_id
             selected_audio_device = HardwareSelector(target_id=target_id)
             logger.info(f"Selected audio device: ID={selected_audio_device.id}, Name='{selected_audio_device.name}'")
         except HardwareNotFound as e:
@@ -201,52 +242,62 @@ class AppArgs:
             sys.exit(1)
 
         final_sample_rate = float(args.sample_rate)
-
-        config = AppConfig(
-            audio_device=selected_audio_device,
-            sample_rate=final_sample_rate,
-            buffer_seconds=buffer_seconds,
-        )
+        sample_rate = final_sample_rate
+        audio_calibrator = None
+        sensitivity_dbfs = None
+        reference_dbspl = None
+        num_taps = None
 
         # --- 5. Calibration Setup ---
-        if args.calibration_file:
-            logger.info(f"Calibration file provided: {args.calibration_file}. Enabling calibration.")
+        if is_calibrated:
+            logger.info(f"Calibration file provided: {cal_file}. Enabling calibration.")
 
             try:
-                native_rate = float(config.audio_device.native_rate)
+                native_rate = float(selected_audio_device.native_rate)
                 if native_rate <= 0:
                     raise ValueError(
-                        f"Invalid native sample rate reported by device: {config.audio_device.native_rate}"
+                        f"Invalid native sample rate reported by device: {selected_audio_device.native_rate}"
                     )
-                config.sample_rate = native_rate
-                logger.info(f"Using device native sample rate for calibration: {config.sample_rate:.0f} Hz.")
+                sample_rate = native_rate
+                logger.info(f"Using device native sample rate for calibration: {sample_rate:.0f} Hz.")
 
             except (AttributeError, ValueError, TypeError) as e:
                 logger.error(
-                    f"Could not determine or use native sample rate from selected device ({config.audio_device.name})."
-                    f" Error: {e}"
+                    f"Could not determine or use native sample rate from selected device"
+                    f" ({selected_audio_device.name}). Error: {e}"
                 )
                 logger.warning(
                     f"Falling back to specified/default sample rate: {final_sample_rate:.0f} Hz."
                     f" Calibration accuracy may be affected."
                 )
-                config.sample_rate = final_sample_rate
-
-            sensitivity_dbfs, reference_dbspl = HardwareCalibrator.get_sensitivity_values(args.calibration_file)
-            config.audio_calibrator = HardwareCalibrator(
-                calibration_file_path=args.calibration_file,
-                sample_rate=config.sample_rate,
+                sample_rate = final_sample_rate
+
+            sensitivity_dbfs, reference_dbspl = HardwareCalibrator.get_sensitivity_values(cal_file)
+            # Parsing can fail; do it here, at startup. Only the FIR design is deferred
+            # until the pipeline first needs it.
+            HardwareCalibrator.validate_calibration_file(cal_file)
+            audio_calibrator = partial(
+                HardwareCalibrator,
+                calibration_file_path=cal_file,
+                sample_rate=sample_rate,
                 num_taps=args.num_taps,
             )
-
-            config.sensitivity_dbfs = sensitivity_dbfs
-            config.reference_dbspl = reference_dbspl
-            config.num_taps = args.num_taps
+            num_taps = args.num_taps
             logger.info("Calibration enabled and initialized.")
 
         else:
             logger.info("No calibration file provided (Arg or Env). Calibration disabled.")
-            logger.info(f"Using specified/default sample rate: {config.sample_rate:.0f} Hz.")
+            logger.info(f"Using specified/default sample rate: {sample_rate:.0f} Hz.")
+
+        config = AppConfig(
+            audio_device=selected_audio_device,
+            sample_rate=sample_rate,
+            buffer_seconds=buffer_seconds,
+            audio_calibrator=audio_calibrator,
+            sensitivity_dbfs=sensitivity_dbfs,
+            reference_dbspl=reference_dbspl,
+            num_taps=num_taps,
+        )
 
         logger.info(
             f"Final Configuration: SR={config.sample_rate:.0f} Hz, Buffer={config.buffer_seconds:.1f}s,"
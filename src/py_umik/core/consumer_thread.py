@@ -13,6 +13,8 @@ import logging
 import queue
 import threading
 
+from .audio_queue import AudioQueue
+from .buffer_pool import AudioBufferPool
 from .pipeline import AudioPipeline
 
 logger = logging.getLogger(__name__)
@@ -24,7 +26,7 @@ class ConsumerThread:
 
     This class acts as the "Consumer" in a producer-consumer pattern. It continuously
     fetches audio data (packaged as a tuple of numpy array and timestamp) from a
-    `queue.Queue` and delegates processing to the `AudioPipeline`.
+    `AudioQueue` and delegates processing to the `AudioPipeline`.
 
     It runs until a `stop_event` is set, ensuring graceful shutdown. It includes
     robust error handling for queue operations and pipeline execution.
@@ -32,26 +34,34 @@ class ConsumerThread:
 
     def __init__(
         self,
-        audio_queue: queue.Queue,
+        audio_queue: AudioQueue,
         stop_event: threading.Event,
         pipeline: AudioPipeline,
-        consumer_queue_timeout_seconds: int,
+        consumer_queue_timeout_seconds: float,
+        buffer_pool: AudioBufferPool | None = None,
+        max_batch_chunks: int = 1,
     ):
         """
         Initializes the audio consumer thread.
 
-        :param audio_queue: The thread-safe `queue.Queue` instance from which
+        :param audio_queue: The thread-safe `AudioQueue` instance from which
                             audio data tuples (audio_chunk, timestamp) will be fetched.
         :param stop_event: A `threading.Event` object used to signal the thread
                            to terminate its loop and exit gracefully.
         :param pipeline: An instance of `AudioPipeline` configured with the
                          necessary processors and sinks to handle the audio data.
         :param consumer_queue_timeout_seconds: Timeout for blocking queue gets.
+        :param buffer_pool: Optional pool the listener draws its block buffers from.
+                            Each chunk is returned to it once the pipeline has run.
+        :param max_batch_chunks: Maximum number of already queued chunks processed
+                                 together in one pipeline run when the consumer lags.
         """
         self._queue = audio_queue
         self._stop_event = stop_event
         self._pipeline = pipeline
         self._consumer_queue_timeout_seconds = consumer_queue_timeout_seconds
+        self._buffer_pool = buffer_pool
+        self._max_batch_chunks = max_batch_chunks
 
         self._class_name = self.__class__.__name__
         logger.info(f"{self._class_name} initialized with pipeline.")
@@ -62,6 +72,9 @@ class ConsumerThread:
 
         Continuously attempts to retrieve audio data (chunk, timestamp) from the queue.
         If data is available, it passes it to the `AudioPipeline.execute()` method.
+        If more chunks are already waiting (the consumer fell behind), up to
+        `max_batch_chunks` of them are drained and run as one batch via
+        `AudioPipeline.execute_batch()`.
 
         Includes timeouts for queue retrieval to remain responsive to the stop signal
         and error handling for execution failures.
@@ -77,11 +90,30 @@ class ConsumerThread:
                     logger.debug("Stop event detected. Discarding remaining queue items.")
                     break
 
-                # Execute the pipeline for this chunk
+                # Drain whatever else is already queued, without waiting
+                audio_chunks = [audio_chunk]
+                timestamps = [timestamp]
+                while len(audio_chunks) < self._max_batch_chunks:
+                    try:
+                        next_chunk, next_timestamp = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    audio_chunks.append(next_chunk)
+                    timestamps.append(next_timestamp)
+
+                # Execute the pipeline for this chunk (or batch of chunks)
                 try:
-                    self._pipeline.execute(audio_chunk, timestamp)
+                    if len(audio_chunks) == 1:
+                        self._pipeline.execute(audio_chunk, timestamp)
+                    else:
+                        self._pipeline.execute_batch(audio_chunks, timestamps)
                 except Exception as e:
                     logger.error(f"Error executing pipeline: {e}", exc_info=True)
+                finally:
+                    # Sinks must not keep references to the chunks beyond handle_audio.
+                    if self._buffer_pool is not None:
+                        for chunk in audio_chunks:
+                            self._buffer_pool.release(chunk)
 
             except queue.Empty:
                 logger.debug("Queue empty, continuing.")
@@ -6,12 +6,41 @@ GitHub: https://github.com/danielfcollier
 Year: 2025
 """
 
+import time
 from datetime import datetime
 
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 class DatetimeStamp:
     @staticmethod
-    def get():
-        now = datetime.now()
-        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
-        return timestamp
+    def get() -> int:
+        """
+        Returns the current wall-clock time as nanoseconds since the epoch.
+
+        This is called once per audio block, so it is a single C call returning
+        an int; conversion to a datetime is deferred to `to_datetime`/`format`.
+
+        :return: The current time in nanoseconds since the epoch.
+        """
+        return time.time_ns()
+
+    @staticmethod
+    def to_datetime(timestamp_ns: int) -> datetime:
+        """
+        Converts a timestamp returned by `get` to a local datetime.
+
+        :param timestamp_ns: Nanoseconds since the epoch.
+        :return: The corresponding local datetime.
+        """
+        return datetime.fromtimestamp(timestamp_ns / 1e9)
+
+    @staticmethod
+    def format(timestamp_ns: int) -> str:
+        """
+        Formats a timestamp returned by `get` as 'YYYY-MM-DD HH:MM:SS'.
+
+        :param timestamp_ns: Nanoseconds since the epoch.
+        :return: The formatted local time.
+        """
+        return DatetimeStamp.to_datetime(timestamp_ns).strftime(TIMESTAMP_FORMAT)
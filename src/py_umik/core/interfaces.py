@@ -9,7 +9,6 @@ GitHub: https://github.com/danielfcollier
 Year: 2025
 """
 
-from datetime import datetime
 from typing import Protocol, runtime_checkable
 
 import numpy as np
@@ -20,6 +19,10 @@ class AudioTransformer(Protocol):
     """
     Protocol for components that transform audio data (e.g., HardwareCalibrator, Filter).
     Input: Raw Audio -> Output: Processed Audio
+
+    Transformers may also define `process_audio_batch(audio_chunks)`, taking and
+    returning a (chunks, block_size) array of consecutive chunks; the pipeline
+    uses it when the consumer processes a backlog as a batch.
     """
 
     def process_audio(self, audio_chunk: np.ndarray) -> np.ndarray: ...
@@ -30,6 +33,9 @@ class AudioSink(Protocol):
     """
     Protocol for components that consume audio data (e.g., Recorder, Meter, GUI).
     Input: Final Audio -> Output: None (Side Effect)
+
+    The chunk buffer may be reused for later audio once `handle_audio` returns;
+    sinks that need the samples afterwards must copy them.
     """
 
-    def handle_audio(self, audio_chunk: np.ndarray, timestamp: datetime) -> None: ...
+    def handle_audio(self, audio_chunk: np.ndarray, timestamp: int) -> None: ...
@@ -13,20 +13,26 @@ Year: 2025
 """
 
 import logging
-import queue
+import os
 import threading
 
+import numpy as np
 import sounddevice as sd
 
 from py_umik.settings import get_settings
 
 from ..hardware.config import HardwareConfig
+from .audio_queue import AudioQueue
+from .buffer_pool import AudioBufferPool
 from .datetime_stamp import DatetimeStamp
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# How often the listener checks that the callback stream is still running.
+STREAM_POLL_SECONDS = 0.5
+
 
 class ListenerThread:
     """
@@ -42,8 +48,9 @@ class ListenerThread:
     def __init__(
         self,
         audio_device_config: HardwareConfig,
-        audio_queue: queue.Queue,
+        audio_queue: AudioQueue,
         stop_event: threading.Event,
+        buffer_pool: AudioBufferPool | None = None,
     ):
         """
         Initializes the audio listener thread.
@@ -52,16 +59,25 @@ class ListenerThread:
                                     audio stream (e.g., sample rate, block size,
                                     device ID, dtype). This configuration dictates how
                                     the audio stream will be opened.
-        :param audio_queue: A thread-safe `queue.Queue` instance. Raw audio chunks
+        :param audio_queue: A thread-safe `AudioQueue` instance. Raw audio chunks
                                     captured from the microphone will be put onto this queue.
         :param stop_event: A `threading.Event` object used to signal the thread
                            to terminate its loop and exit gracefully. This event
                            is typically set by the main application thread upon
                            receiving a shutdown signal (SIGINT/SIGTERM).
+        :param buffer_pool: Optional pool of reusable block buffers. When given, blocks
+                            are copied into pooled buffers instead of new arrays.
         """
         self._audio_device_config = audio_device_config
+        # Stream parameters are fixed for the thread's lifetime; read them once.
+        self._device_id = audio_device_config.id
+        self._sample_rate = audio_device_config.sample_rate
+        self._dtype = audio_device_config.dtype
+        self._block_size = audio_device_config.block_size
         self._queue = audio_queue
         self._stop_event = stop_event
+        self._buffer_pool = buffer_pool
+        self._listener_core = audio_device_config.listener_core
 
         self._class_name = self.__class__.__name__
         logger.debug(f"{self._class_name} initialized.")
@@ -69,19 +85,108 @@ class ListenerThread:
         self._reconnect_delay_seconds = settings.RECONNECT_DELAY_SECONDS
         self._max_retries = settings.RECONNECT_MAX_RETRIES
 
+    def _make_audio_callback(self):
+        """
+        Builds the PortAudio stream callback, specialized for this stream.
+
+        The stream configuration is fixed for the thread's lifetime, so the
+        callback is generated once per stream with everything it needs (queue
+        insertion, buffer pool, block size) bound as closure variables. The
+        pool/no-pool choice is made here rather than on every block.
+
+        `indata` is PortAudio's own buffer, which is reused once the callback
+        returns, so the mono column is copied out exactly once and queued with
+        its capture timestamp. Software-side overflow is handled by the bounded
+        queue (drops the oldest chunk).
+
+        Capture runs on PortAudio's callback thread, not on this one, so a
+        configured `listener_core` is applied from inside the callback on its
+        first call (see `_pin_callback`).
+
+        :return: A function with the `sounddevice` callback signature
+                 (indata, frames, time_info, status).
+        """
+        put = self._queue.put_nowait
+        get_timestamp = DatetimeStamp.get
+        device_id = self._device_id
+
+        def report_overflow():
+            logger.warning(f"Input overflow detected on device {device_id}. Audio data lost from hardware buffer.")
+
+        if self._buffer_pool is None:
+
+            def on_audio(indata, frames: int, time_info, status: sd.CallbackFlags):
+                if status.input_overflow:
+                    report_overflow()
+                put((indata[:, 0].copy(), get_timestamp()))
+
+            return self._pin_callback(on_audio)
+
+        acquire = self._buffer_pool.acquire
+        copyto = np.copyto
+        block_size = self._block_size
+
+        def on_audio_pooled(indata, frames: int, time_info, status: sd.CallbackFlags):
+            if status.input_overflow:
+                report_overflow()
+            timestamp = get_timestamp()
+            if frames == block_size:
+                audio_chunk = acquire()
+                copyto(audio_chunk, indata[:, 0])
+            else:
+                audio_chunk = indata[:, 0].copy()
+            put((audio_chunk, timestamp))
+
+        return self._pin_callback(on_audio_pooled)
+
+    def _pin_callback(self, callback):
+        """
+        Wraps a stream callback so it pins PortAudio's callback thread to `listener_core`.
+
+        The affinity is set once, on the first block of the stream; every later
+        call only tests a flag. It is a no-op when no core is configured or the
+        platform lacks `os.sched_setaffinity` (i.e., anything but Linux).
+
+        :param callback: The stream callback to wrap.
+        :return: The wrapped callback, or `callback` itself when pinning does not apply.
+        """
+        core = self._listener_core
+        if core is None or not hasattr(os, "sched_setaffinity"):
+            return callback
+
+        pinned = False
+
+        def pinned_callback(indata, frames: int, time_info, status: sd.CallbackFlags):
+            nonlocal pinned
+            if not pinned:
+                pinned = True
+                try:
+                    # On Linux, pid 0 targets the calling (callback) thread only.
+                    os.sched_setaffinity(0, {core})
+                    logger.debug(f"Audio callback thread pinned to CPU core {core}.")
+                except OSError as e:
+                    logger.warning(f"Could not pin the audio callback thread to CPU core {core}: {e}")
+            callback(indata, frames, time_info, status)
+
+        return pinned_callback
+
     def run(self):
         """
         The main execution loop with built-in hardware recovery.
 
-        Continuously reads audio chunks from the configured input device via
-        `sounddevice.InputStream` and puts them onto the queue as tuples containing
-        the audio data (numpy array) and a timestamp.
+        Opens a callback-driven `sounddevice.InputStream`: PortAudio hands every
+        block to the callback built by `_make_audio_callback`, which puts it onto the queue as a tuple containing
+        the audio data (numpy array) and a timestamp. This thread only supervises
+        the stream.
 
         1. Enters a 'Reconnection Loop'.
         2. Tries to open the InputStream.
-        3. If successful, RESETS retry count and enters 'Read Loop'.
-        4. If it fails, increments retry count.
+        3. If successful, RESETS retry count and watches the stream until shutdown.
+        4. If it fails (or the stream stops on its own), increments retry count.
         5. If retries exceed limit, signals app shutdown.
+
+        Any other exception propagates to the thread guard installed by the
+        application (`ThreadApp._thread_guard`), which logs it and shuts down.
         """
         logger.info(f"{self._class_name} thread started.")
 
@@ -90,44 +195,25 @@ class ListenerThread:
         # --- 1. Reconnection Loop (The Watchdog) ---
         while not self._stop_event.is_set():
             try:
-                device_id = self._audio_device_config.id
-                sample_rate = self._audio_device_config.sample_rate
-                dtype = self._audio_device_config.dtype
-                block_size = self._audio_device_config.block_size
-
                 with sd.InputStream(
-                    device=device_id,
-                    blocksize=block_size,
-                    samplerate=sample_rate,
-                    dtype=dtype,
+                    device=self._device_id,
+                    blocksize=self._block_size,
+                    samplerate=self._sample_rate,
+                    dtype=self._dtype,
                     channels=1,
+                    callback=self._make_audio_callback(),
                 ) as stream:
                     retry_count = 0
 
-                    logger.debug(f"Microphone stream started on Device ID {device_id} at ({sample_rate}Hz).")
-
-                    # --- 2. Read Loop (The Capture) ---
-                    while not self._stop_event.is_set():
-                        audio_chunk, overflow = stream.read(block_size)
-
-                        if overflow:
-                            logger.warning(
-                                f"Input overflow detected on device {device_id}. Audio data lost from hardware buffer."
-                            )
-
-                        timestamp = DatetimeStamp.get()
-
-                        # --- 3. Buffer Overflow Handling (Software side) ---
-                        try:
-                            if audio_chunk.ndim > 1:
-                                audio_chunk = audio_chunk.flatten()
-
-                            self._queue.put_nowait((audio_chunk, timestamp))
+                    logger.debug(
+                        f"Microphone stream started on Device ID {self._device_id} at ({self._sample_rate}Hz)."
+                    )
 
-                        except queue.Full:
-                            logger.warning(
-                                "Consumer queue is full! Dropping audio chunk to maintain real-time monitoring."
-                            )
+                    # --- 2. Capture (runs in the stream callback) ---
+                    # PortAudio deactivates the stream if the device goes away.
+                    while not self._stop_event.wait(STREAM_POLL_SECONDS):
+                        if not stream.active:
+                            raise sd.PortAudioError("Audio stream stopped unexpectedly.")
 
             except (sd.PortAudioError, OSError) as e:
                 retry_count += 1
@@ -144,9 +230,4 @@ class ListenerThread:
                 logger.info(f"Waiting {self._reconnect_delay_seconds}s before reconnecting...")
                 self._stop_event.wait(self._reconnect_delay_seconds)
 
-            except Exception as e:
-                logger.critical(f"Unexpected fatal error in ListenerThread: {e}", exc_info=True)
-                self._stop_event.set()
-                break
-
         logger.info(f"{self._class_name} thread finished.")
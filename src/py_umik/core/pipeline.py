@@ -10,7 +10,7 @@ GitHub: https://github.com/danielfcollier
 Year: 2025
 """
 
-from datetime import datetime
+from collections.abc import Callable
 
 import numpy as np
 
@@ -25,24 +25,111 @@ class AudioPipeline:
     def __init__(self):
         self._processors: list[AudioTransformer] = []
         self._sinks: list[AudioSink] = []
+        self._compiled: Callable[[np.ndarray, int], None] | None = None
+        self._compiled_batch: Callable[[list[np.ndarray], list[int]], None] | None = None
 
     def add_transformer(self, processor: AudioTransformer):
         """Adds a transformer to the chain (order matters)."""
         self._processors.append(processor)
+        self._compiled = None
+        self._compiled_batch = None
 
     def add_sink(self, sink: AudioSink):
         """Adds a consumer to the end of the chain."""
         self._sinks.append(sink)
+        self._compiled = None
+        self._compiled_batch = None
 
-    def execute(self, audio_chunk: np.ndarray, timestamp: datetime):
+    def compile(self) -> Callable[[np.ndarray, int], None]:
+        """
+        Fuses the current transformers and sinks into a single callable.
+
+        The bound `process_audio`/`handle_audio` methods are resolved once and
+        captured as tuples, so running a chunk costs one function call per stage
+        instead of attribute lookups on every component for every chunk.
+        Adding a transformer or sink invalidates the compiled chain; `execute`
+        recompiles it on demand.
+
+        :return: A function taking (audio_chunk, timestamp) that runs the whole pipeline.
+        """
+        transforms = tuple(processor.process_audio for processor in self._processors)
+        batch_transforms = tuple(self._batch_transform(processor) for processor in self._processors)
+        handlers = tuple(sink.handle_audio for sink in self._sinks)
+
+        def run(audio_chunk: np.ndarray, timestamp: int):
+            # 1. Transform: Pass audio through all processors sequentially
+            for transform in transforms:
+                audio_chunk = transform(audio_chunk)
+
+            # 2. Fan-out: Deliver the final audio to all sinks
+            for handle_audio in handlers:
+                handle_audio(audio_chunk, timestamp)
+
+        def run_batch(audio_chunks: list[np.ndarray], timestamps: list[int]):
+            # 1. Transform the whole (chunks, block_size) batch in one call per processor
+            batch = np.stack(audio_chunks)
+            for transform_batch in batch_transforms:
+                batch = transform_batch(batch)
+
+            # 2. Fan-out: sinks still see one chunk (a row view) at a time
+            for audio_chunk, timestamp in zip(batch, timestamps, strict=True):
+                for handle_audio in handlers:
+                    handle_audio(audio_chunk, timestamp)
+
+        self._compiled = run
+        self._compiled_batch = run_batch
+        return run
+
+    @staticmethod
+    def _batch_transform(processor: AudioTransformer) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Resolves how a transformer processes a (chunks, block_size) batch.
+
+        Transformers may implement `process_audio_batch`; otherwise the rows
+        are processed as one continuous block through `process_audio`.
+
+        :param processor: The transformer.
+        :return: A function mapping a batch to a batch of the same shape.
+        """
+        process_audio_batch = getattr(processor, "process_audio_batch", None)
+        if process_audio_batch is not None:
+            return process_audio_batch
+
+        process_audio = processor.process_audio
+
+        def process_rows(batch: np.ndarray) -> np.ndarray:
+            return process_audio(batch.reshape(-1)).reshape(batch.shape)
+
+        return process_rows
+
+    def execute(self, audio_chunk: np.ndarray, timestamp: int):
         """
         Runs the pipeline for a single audio chunk.
         """
-        # 1. Transform: Pass audio through all processors sequentially
-        processed_chunk = audio_chunk
-        for processor in self._processors:
-            processed_chunk = processor.process_audio(processed_chunk)
+        run = self._compiled or self.compile()
+        run(audio_chunk, timestamp)
+
+    def execute_batch(self, audio_chunks: list[np.ndarray], timestamps: list[int]):
+        """
+        Runs the pipeline once for several consecutive audio chunks.
+
+        Equal-length chunks are stacked into a (chunks, block_size) array, so
+        each transformer is dispatched once per batch, and each sink then gets
+        the chunks one by one with their own timestamps. Chunks of different
+        lengths are joined and run as a single block (first timestamp).
+        Stateful transformers (e.g., the FIR calibrator) see the same
+        continuous signal either way.
+
+        :param audio_chunks: Consecutive audio chunks, oldest first.
+        :param timestamps: The timestamp of each chunk.
+        """
+        if len({len(audio_chunk) for audio_chunk in audio_chunks}) > 1:
+            self.execute(np.concatenate(audio_chunks), timestamps[0])
+            return
 
-        # 2. Fan-out: Deliver the final audio to all sinks
-        for sink in self._sinks:
-            sink.handle_audio(processed_chunk, timestamp)
+        run_batch = self._compiled_batch
+        if run_batch is None:
+            self.compile()
+            run_batch = self._compiled_batch
+            assert run_batch is not None
+        run_batch(audio_chunks, timestamps)
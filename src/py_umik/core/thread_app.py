@@ -11,13 +11,19 @@ Year: 2025
 """
 
 import logging
+import os
 import queue
 import signal
 import threading
 from abc import ABC, abstractmethod
 
+from ..settings import get_settings
+from .audio_queue import AudioQueue
+
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
 
 class ThreadApp(ABC):
     """
@@ -32,10 +38,11 @@ class ThreadApp(ABC):
         multi-threaded application.
         """
         self._stop_event = threading.Event()
-        self._queue = queue.Queue()
+        # Bounded, lock-free hand-off for the audio blocks (drops the oldest when full).
+        self._queue: AudioQueue = AudioQueue(maxlen=settings.AUDIO_QUEUE_MAX_CHUNKS)
         self._data_lock = threading.Lock()
         self._threads: list[threading.Thread] = []
-        self._error_queue = queue.Queue()
+        self._error_queue: queue.Queue[Exception] = queue.Queue()
 
     def _handle_signal(self, signum, frame):
         """
@@ -107,6 +114,36 @@ class ThreadApp(ABC):
 
         return guarded_function
 
+    @staticmethod
+    def _pin_to_core(target_function, core: int | None):
+        """
+        A wrapper function that pins the calling thread to a single CPU core
+        before running the thread target.
+
+        Keeping the consumer on a fixed core avoids scheduler migrations (and
+        the cache refills that come with them) on the audio path. Capture runs
+        on PortAudio's callback thread, which the listener pins itself.
+        It is a no-op when no core is given or the platform lacks
+        `os.sched_setaffinity` (i.e., anything but Linux).
+
+        :param target_function: The original target function for the thread.
+        :param core: The CPU core index to pin to, or None to leave it unpinned.
+        :return: A wrapped function that applies the affinity first.
+        """
+        if core is None or not hasattr(os, "sched_setaffinity"):
+            return target_function
+
+        def pinned_function(*args, **kwargs):
+            try:
+                # On Linux, pid 0 targets the calling thread only.
+                os.sched_setaffinity(0, {core})
+                logger.debug(f"{threading.current_thread().name} pinned to CPU core {core}.")
+            except OSError as e:
+                logger.warning(f"Could not pin {threading.current_thread().name} to CPU core {core}: {e}")
+            target_function(*args, **kwargs)
+
+        return pinned_function
+
     def close(self):
         """
         Performs final cleanup operations.
@@ -12,9 +12,12 @@ Year: 2025
 
 import logging
 import os
+import re
+from functools import lru_cache
 
+import numba
 import numpy as np
-from scipy.signal import firwin2, lfilter
+from scipy.signal import firwin2, oaconvolve
 
 from ..settings import get_settings
 from .cache_strategy import FileFilterCache, FilterCacheStrategy
@@ -23,6 +26,69 @@ settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# The "Sens Factor" header, e.g. '"Sens Factor" =-1.23dB, SERNO: 7000000'.
+_SENS_FACTOR_RE = re.compile(r'Sens Factor"?\s*=\s*([-+]?(?:\d+\.?\d*|\.\d+))\s*dB')
+
+# Below this many taps a direct-form FIR beats FFT convolution (no FFT set-up cost).
+DIRECT_FIR_MAX_TAPS = 128
+
+
+# Compiled eagerly at import (like the audio_metrics kernels), so the first audio block does not wait on the JIT.
+@numba.njit("void(float32[::1], float32[::1], float32[::1])", fastmath=True, cache=True, boundscheck=False)
+def _fir_direct(extended_chunk: np.ndarray, reversed_taps: np.ndarray, out: np.ndarray):
+    """
+    Direct-form FIR filter ('valid' convolution) compiled by Numba.
+
+    Both arrays are walked contiguously, so LLVM turns the inner
+    multiply-accumulate into SIMD FMA instructions.
+
+    :param extended_chunk: The previous (taps - 1) input samples followed by the new chunk.
+    :param reversed_taps: The filter taps in reverse order.
+    :param out: Output array with one sample per new input sample.
+    """
+    n_taps = reversed_taps.shape[0]
+    for i in range(out.shape[0]):
+        acc = np.float32(0.0)
+        for j in range(n_taps):
+            acc += reversed_taps[j] * extended_chunk[i + j]
+        out[i] = acc
+
+
+def _design_filter_taps(calibration_file_path: str, num_taps: int, sample_rate: float) -> np.ndarray:
+    """
+    Parses a calibration file and designs its correction filter (uncached).
+
+    :param calibration_file_path: Path to the calibration .txt file.
+    :param num_taps: The number of coefficients (taps) for the FIR filter.
+    :param sample_rate: The sample rate the filter is designed for.
+    :return: The filter taps.
+    """
+    freqs, gains = HardwareCalibrator._parse_frequency_response(calibration_file_path)
+    return HardwareCalibrator._design_fir_filter(freqs, gains, num_taps, sample_rate)
+
+
+@lru_cache(maxsize=32)
+def _design_correction_filter(
+    calibration_file_path: str, mtime_ns: int | None, num_taps: int, sample_rate: float
+) -> np.ndarray:
+    """
+    Parses a calibration file and designs its correction filter, memoized in-process.
+
+    The file's modification time is part of the key, so editing the file
+    invalidates the entry. This sits in front of the on-disk FilterCacheStrategy
+    and spares repeated constructions (tests, app restarts within one process)
+    both the file I/O and the `firwin2` design.
+
+    :param calibration_file_path: Path to the calibration .txt file.
+    :param mtime_ns: The file's modification time in nanoseconds (cache key only).
+    :param num_taps: The number of coefficients (taps) for the FIR filter.
+    :param sample_rate: The sample rate the filter is designed for.
+    :return: The filter taps as a read-only array (it is shared between callers).
+    """
+    filter_taps = _design_filter_taps(calibration_file_path, num_taps, sample_rate)
+    filter_taps.setflags(write=False)
+    return filter_taps
+
 
 class HardwareCalibrator:
     """
@@ -71,7 +137,7 @@ class HardwareCalibrator:
         logger.debug(f"Using cache key/path: {taps_file}")
 
         # --- 1. Attempt Load ---
-        self._filter_taps = None
+        filter_taps: np.ndarray | None = None
 
         if not force_write:
             loaded_taps = self._cache_strategy.load(taps_file)
@@ -82,90 +148,102 @@ class HardwareCalibrator:
                         f"requested length ({num_taps} - 1). Will redesign."
                     )
                 else:
-                    self._filter_taps = loaded_taps
+                    filter_taps = loaded_taps
                     logger.debug("Cached filter loaded successfully.")
 
         # --- 2. Design & Save (if load failed or forced) ---
-        if self._filter_taps is None:
+        if filter_taps is None:
             if force_write:
                 logger.info("Force_write enabled. Redesigning filter...")
             else:
                 logger.info(f"No valid cached filter found for '{taps_file}'.")
 
             logger.info(f"Designing new {num_taps}-tap filter from '{calibration_file_path}'...")
-            freqs, gains = self._parse_frequency_response(calibration_file_path)
-            self._filter_taps = self._design_fir_filter(freqs, gains, num_taps)
+            try:
+                mtime_ns = os.stat(calibration_file_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            # Without an mtime the file cannot be keyed reliably; force_write asks for a fresh design.
+            if force_write or mtime_ns is None:
+                filter_taps = _design_filter_taps(calibration_file_path, num_taps, sample_rate)
+            else:
+                filter_taps = _design_correction_filter(calibration_file_path, mtime_ns, num_taps, sample_rate)
 
             logger.info("Saving new filter to cache...")
-            self._cache_strategy.save(taps_file, self._filter_taps)
+            self._cache_strategy.save(taps_file, filter_taps)
 
-        self._filter_state = np.zeros(len(self._filter_taps) - 1)
+        # Filter in float32 (the stream's dtype): half the memory traffic of float64.
+        self._filter_taps = np.ascontiguousarray(filter_taps, dtype=np.float32)
+        # Reversed once here, so the direct-form kernel walks both arrays forwards without a per-chunk copy.
+        self._reversed_taps = np.ascontiguousarray(self._filter_taps[::-1])
+        # Filter state: the last (taps - 1) input samples of the previous chunk.
+        self._filter_state = np.zeros(len(self._filter_taps) - 1, dtype=np.float32)
 
         logger.info("✅ HardwareCalibrator initialized. Filter is ready.")
 
-    def _parse_frequency_response(self, file_path: str) -> tuple[np.ndarray, np.ndarray]:
+    @staticmethod
+    def _is_data_line(line: str) -> bool:
+        """
+        Checks whether a line starts with two numeric values (frequency and gain).
+
+        :param line: A line of the calibration file.
+        :return: True if the first two whitespace-separated fields are numbers.
+        """
+        parts = line.split()
+        if len(parts) < 2:
+            return False
+        try:
+            float(parts[0])
+            float(parts[1])
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _parse_frequency_response(file_path: str) -> tuple[np.ndarray, np.ndarray]:
         """
         Parses the frequency response data (Hz vs dB) from a calibration file.
 
         Handles files with whitespace delimiters (tabs, spaces) and skips
         initial header/comment lines until it finds the first line containing
-        two valid numeric values (frequency and gain).
+        two valid numeric values (frequency and gain). The table itself is
+        tokenized in C by `np.loadtxt`; only if it is followed by non-numeric
+        content is the end of the table located line by line.
 
         :param file_path: The full path to the calibration .txt file.
         :return: A tuple containing two NumPy arrays: (frequencies, gains_db).
         :raises SystemExit: If the file is not found, empty, or contains no valid data.
         """
-        frequencies, gains_db = [], []
-        data_started = False
-
         try:
             with open(file_path, encoding="utf-8") as f:
                 lines = f.readlines()
 
-            for line_num, line in enumerate(lines, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        freq = float(parts[0])
-                        gain = float(parts[1])
-
-                        frequencies.append(freq)
-                        gains_db.append(gain)
-                        data_started = True
-
-                    except ValueError:
-                        if not data_started:
-                            logger.debug(f"Skipping potential header/comment line {line_num}: '{line}'")
-                            continue
-                        else:
-                            logger.warning(
-                                f"Found non-numeric data after valid data started (line {line_num}). "
-                                f"Stopping parse. Line: '{line}'"
-                            )
-                            break
-                elif not data_started:
-                    logger.debug(f"Skipping potential header/comment line {line_num}: '{line}'")
-                    continue
-                else:
-                    logger.warning(
-                        "Found line with unexpected format after valid data "
-                        f"started (line {line_num}). Stopping parse. Line: '{line}'"
-                    )
-                    break
-
-            if not frequencies:
+            start = next((i for i, line in enumerate(lines) if HardwareCalibrator._is_data_line(line)), None)
+            if start is None:
                 logger.critical(
                     "No valid frequency/gain data pairs (two numeric columns "
                     f"separated by whitespace) found in '{file_path}'."
                 )
                 exit(1)
+            if start:
+                logger.debug(f"Skipped {start} header/comment line(s) before the calibration table.")
+
+            table = lines[start:]
+            try:
+                data = np.loadtxt(table, usecols=(0, 1), ndmin=2, comments=None)
+            except ValueError:
+                # Something other than the table follows it; keep everything up to that line.
+                stop = next(
+                    i for i, line in enumerate(table) if line.strip() and not HardwareCalibrator._is_data_line(line)
+                )
+                logger.warning(
+                    "Found line with unexpected format after valid data "
+                    f"started (line {start + stop + 1}). Stopping parse. Line: '{table[stop].strip()}'"
+                )
+                data = np.loadtxt(table[:stop], usecols=(0, 1), ndmin=2, comments=None)
 
-            logger.info(f"Parsed {len(frequencies)} frequency/gain points.")
-            return np.array(frequencies), np.array(gains_db)
+            logger.info(f"Parsed {len(data)} frequency/gain points.")
+            return data[:, 0].copy(), data[:, 1].copy()
 
         except FileNotFoundError:
             logger.critical(f"Calibration file not found at '{file_path}'. Please check the path.")
@@ -176,7 +254,8 @@ class HardwareCalibrator:
             )
             exit(1)
 
-    def _design_fir_filter(self, freqs: np.ndarray, gains: np.ndarray, num_taps: int) -> np.ndarray:
+    @staticmethod
+    def _design_fir_filter(freqs: np.ndarray, gains: np.ndarray, num_taps: int, sample_rate: float) -> np.ndarray:
         """
         Designs a Finite Impulse Response (FIR) filter based on microphone calibration data.
 
@@ -194,6 +273,7 @@ class HardwareCalibrator:
                         This determines the filter's length, accuracy, and computational cost.
                         A higher number generally provides better accuracy, especially at
                         low frequencies, but increases the processing load during filtering.
+        :param sample_rate: The sample rate (in Hz) the filter is designed for.
         :return: A NumPy array containing the calculated FIR filter coefficients (taps).
         """
         # Calculate the required correction gains (inverse of microphone's gain in dB).
@@ -202,7 +282,7 @@ class HardwareCalibrator:
         correction_gains_linear = 10.0 ** (correction_gains_db / 20.0)
 
         # Normalize the frequency axis to the range [0, 1], where 1 represents Nyquist frequency.
-        nyquist = self._sample_rate / 2.0
+        nyquist = sample_rate / 2.0
         normalized_freqs = freqs / nyquist
 
         # firwin2 requires the frequency list to start at 0 and end at 1.
@@ -223,21 +303,42 @@ class HardwareCalibrator:
         """
         Applies the pre-designed FIR correction filter to a chunk of audio in real-time.
 
-        Uses lfilter with state (`zi`/`zo`) to handle continuous filtering across chunks.
+        Uses FFT overlap-add convolution (`oaconvolve`), which costs O(N log M)
+        per chunk instead of the O(N * M) of a direct-form filter. Short filters
+        (fewer than DIRECT_FIR_MAX_TAPS taps) run the Numba direct-form kernel
+        instead, which is faster when there are few taps. Continuity
+        across chunks is kept by prepending the tail of the previous chunk's
+        input, so the output is identical to filtering the stream in one go.
 
         :param audio_chunk: A numpy array of raw audio samples from the microphone.
         :return: A numpy array of calibrated (frequency-corrected) audio samples.
         """
-        # Apply the FIR filter using lfilter.
-        # `zi` provides the initial state from the previous chunk.
-        # `zo` (returned as the second element) becomes the state for the *next* chunk.
-        calibrated_chunk, self._filter_state = lfilter(self._filter_taps, 1.0, audio_chunk, zi=self._filter_state)
+        extended_chunk = np.concatenate((self._filter_state, audio_chunk))
+        if len(self._filter_taps) < DIRECT_FIR_MAX_TAPS:
+            calibrated_chunk = np.empty(len(audio_chunk), dtype=np.float32)
+            _fir_direct(extended_chunk.astype(np.float32, copy=False), self._reversed_taps, calibrated_chunk)
+        else:
+            calibrated_chunk = oaconvolve(extended_chunk, self._filter_taps, mode="valid")
+        self._filter_state = extended_chunk[len(audio_chunk) :]
 
         if calibrated_chunk.dtype != audio_chunk.dtype:
             calibrated_chunk = calibrated_chunk.astype(audio_chunk.dtype)
 
         return calibrated_chunk
 
+    @staticmethod
+    def validate_calibration_file(file_path: str) -> None:
+        """
+        Parses the frequency response table of a calibration file without designing a filter.
+
+        Lets the configuration reject a missing or malformed file at startup,
+        while the (costly) FIR design itself can still be deferred.
+
+        :param file_path: Path to the .txt calibration file.
+        :raises SystemExit: If the file is not found, empty, or contains no valid data.
+        """
+        HardwareCalibrator._parse_frequency_response(file_path)
+
     @staticmethod
     def get_sensitivity_values(file_path: str) -> tuple[float, float]:
         """
@@ -267,26 +368,23 @@ class HardwareCalibrator:
             with open(file_path, encoding="utf-8") as f:
                 # Iterate through the first few lines to find the header
                 for line_num, line in enumerate(f):
-                    line = line.strip()  # Remove leading/trailing whitespace
-                    if "Sens Factor" in line:
-                        try:
-                            # --- Parse the "Sens Factor" line ---
-                            factor_str = line.split("=")[1].split("dB")[0].strip()
-                            sens_factor_db = float(factor_str)
-
-                            calculated_sensitivity_dbfs = nominal_sensitivity_dbfs + sens_factor_db
-
-                            logger.info(
-                                f"✅ Found 'Sens Factor': {sens_factor_db:.3f} dB for reference"
-                                f" {reference_dbspl:.2f} dBSPL"
-                            )
-                            return calculated_sensitivity_dbfs, reference_dbspl
-
-                        except (ValueError, IndexError, TypeError) as parse_error:
-                            raise ValueError(
-                                f"Could not parse 'Sens Factor' line (line {line_num + 1}): '{line}'. "
-                                f"Expected format like 'Sens Factor =-X.Xd B,...'. Error: {parse_error}"
-                            )
+                    if "Sens Factor" not in line:
+                        continue
+
+                    match = _SENS_FACTOR_RE.search(line)
+                    if match is None:
+                        raise ValueError(
+                            f"Could not parse 'Sens Factor' line (line {line_num + 1}): '{line.strip()}'. "
+                            f"Expected format like 'Sens Factor =-X.XdB,...'."
+                        )
+
+                    sens_factor_db = float(match.group(1))
+                    calculated_sensitivity_dbfs = nominal_sensitivity_dbfs + sens_factor_db
+
+                    logger.info(
+                        f"✅ Found 'Sens Factor': {sens_factor_db:.3f} dB for reference {reference_dbspl:.2f} dBSPL"
+                    )
+                    return calculated_sensitivity_dbfs, reference_dbspl
         except FileNotFoundError:
             logger.error(f"Calibration file not found: {file_path}")
             raise
@@ -9,6 +9,8 @@ GitHub: https://github.com/danielfcollier
 Year: 2025
 """
 
+from collections.abc import Callable
+
 import numpy as np
 
 from ..core.interfaces import AudioTransformer
@@ -16,8 +18,46 @@ from .calibrator import HardwareCalibrator
 
 
 class HardwareCalibratorAdapter(AudioTransformer):
-    def __init__(self, calibrator: HardwareCalibrator):
-        self.calibrator = calibrator
+    def __init__(self, calibrator_factory: Callable[[], HardwareCalibrator]):
+        """
+        :param calibrator_factory: Builds the HardwareCalibrator. It is only called when
+                                   the calibrator is first needed, so the FIR design is
+                                   skipped entirely if no audio is ever processed. The
+                                   calibration file should already have been validated
+                                   (see `HardwareCalibrator.validate_calibration_file`).
+        """
+        self._calibrator_factory = calibrator_factory
+        self._calibrator: HardwareCalibrator | None = None
+
+    @property
+    def calibrator(self) -> HardwareCalibrator:
+        """
+        The wrapped HardwareCalibrator, created on first access.
+
+        :raises RuntimeError: If the calibrator cannot be built. The calibrator exits
+                              on unreadable files; that is re-raised as an Exception so
+                              the consumer's thread guard shuts the application down.
+        """
+        if self._calibrator is None:
+            try:
+                self._calibrator = self._calibrator_factory()
+            except SystemExit as e:
+                raise RuntimeError("Failed to initialize the HardwareCalibrator.") from e
+        return self._calibrator
 
     def process_audio(self, audio_chunk: np.ndarray) -> np.ndarray:
-        return self.calibrator.apply(audio_chunk)
+        # The calibrator filters in float32; make sure the input matches (no copy if it already does).
+        return self.calibrator.apply(audio_chunk.astype(np.float32, copy=False))
+
+    def process_audio_batch(self, audio_chunks: np.ndarray) -> np.ndarray:
+        """
+        Calibrates a (chunks, block_size) batch of consecutive chunks in one filter call.
+
+        The rows are filtered as one continuous signal, so the overlap-add FFT
+        set-up is paid once per batch rather than once per chunk.
+
+        :param audio_chunks: Consecutive chunks stacked row-wise, oldest first.
+        :return: The calibrated chunks, same shape.
+        """
+        flat = audio_chunks.astype(np.float32, copy=False).reshape(-1)
+        return self.calibrator.apply(flat).reshape(audio_chunks.shape)
@@ -35,6 +35,8 @@ class HardwareConfig:
         buffer_seconds: float,
         dtype: str | None = None,
         high_priority: bool | None = None,
+        listener_core: int | None = None,
+        consumer_core: int | None = None,
     ):
         """
         Initializes the audio device configuration object.
@@ -53,6 +55,11 @@ class HardwareConfig:
                               processing for the audio stream from the operating system.
                               Crucial for real-time applications to prevent buffer overflows.
                               Defaults to False.
+        :param listener_core: CPU core to pin PortAudio's capture callback thread to (Linux only).
+                              Applied by the listener on the stream's first callback.
+                              Defaults to None, leaving placement to the OS scheduler.
+        :param consumer_core: CPU core to pin the audio consumer thread to (Linux only).
+                              Defaults to None, leaving placement to the OS scheduler.
         """
         self.id = target_audio_device.id
         self.native_rate = target_audio_device.native_rate
@@ -62,6 +69,8 @@ class HardwareConfig:
 
         self.dtype = dtype if dtype is not None else settings.AUDIO.DTYPE
         self.high_priority = high_priority if high_priority is not None else settings.AUDIO.HIGH_PRIORITY
+        self.listener_core = listener_core
+        self.consumer_core = consumer_core
 
         logger.debug(
             f"HardwareConfig initialized: Device ID={self.id}, SR={self.sample_rate}Hz,"
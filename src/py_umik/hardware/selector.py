@@ -9,6 +9,7 @@ Year: 2025
 """
 
 import logging
+from functools import lru_cache
 
 import sounddevice as sd
 
@@ -44,10 +45,15 @@ class HardwareSelector:
         HardwareSelector.show_audio_devices(self.id)
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def find_device_by_name(name_substring: str) -> int | None:
         """
         Searches for the first input device that contains the given substring in its name.
 
+        Results are cached per name, so the device list is only enumerated once.
+        Callers that re-resolve a device after a hot-plug (e.g., running
+        `AppArgs.validate_args` again) must call `invalidate_device_cache` first.
+
         :param name_substring: The string to search for (case-insensitive).
         :return: The device ID (index) if found, otherwise None.
         """
@@ -60,6 +66,14 @@ class HardwareSelector:
             logger.error(f"Error searching for device '{name_substring}': {e}")
         return None
 
+    @staticmethod
+    def invalidate_device_cache():
+        """
+        Clears the cached `find_device_by_name` results, so the next lookup
+        enumerates the audio devices again (e.g., after a USB hot-plug).
+        """
+        HardwareSelector.find_device_by_name.cache_clear()
+
     def _get_audio_device(self, target_id: int | None = None) -> dict:
         """
         Queries the system for available devices and returns the desired one.
@@ -57,7 +57,7 @@ class IORecorder:
 
     def _generate_filename(self) -> str:
         """Generates a filename with the current timestamp."""
-        timestamp = DatetimeStamp.get()
+        timestamp = DatetimeStamp.format(DatetimeStamp.get())
 
         if self._base_path.suffix:
             name = f"{self._base_path.stem}_{timestamp}{self._base_path.suffix}"
@@ -11,7 +11,6 @@ Year: 2025
 """
 
 import logging
-from datetime import datetime
 
 import numpy as np
 
@@ -34,7 +33,7 @@ class IORecorderAdapter(AudioSink):
         """
         self._manager = manager
 
-    def handle_audio(self, audio_chunk: np.ndarray, timestamp: datetime) -> None:
+    def handle_audio(self, audio_chunk: np.ndarray, timestamp: int) -> None:
         """
         Receives a float32 audio chunk from the pipeline, converts it to int16,
         and passes it to the recording manager.
@@ -0,0 +1,40 @@
+"""
+Provides helpers for reading WAV files for offline analysis.
+
+Shared by the single-file metrics analyzer and the batch analysis script,
+so both decode and mix down audio the same way.
+
+Author: Daniel Collier
+GitHub: https://github.com/danielfcollier
+Year: 2025
+"""
+
+import numpy as np
+import soundfile as sf
+
+
+def read_mono(wav: sf.SoundFile, block_frames: int = 65536) -> np.ndarray:
+    """
+    Mixes a multichannel file down to mono while reading it block by block.
+
+    Channels are summed in float32 straight into the preallocated mono output,
+    so the full multichannel signal (or a float64 mean of it) is never materialized.
+
+    :param wav: An open soundfile.SoundFile positioned at the first frame.
+    :param block_frames: Number of frames decoded per block.
+    :return: A float32 numpy array with the mono mix.
+    """
+    mono = np.empty(wav.frames, dtype=np.float32)
+    block = np.empty((block_frames, wav.channels), dtype=np.float32)
+
+    pos = 0
+    while pos < len(mono):
+        frames = wav.read(out=block)
+        if len(frames) == 0:
+            break
+        np.sum(frames, axis=1, out=mono[pos : pos + len(frames)])
+        pos += len(frames)
+
+    mono = mono[:pos]
+    mono *= 1.0 / wav.channels
+    return mono
@@ -9,10 +9,15 @@ Year: 2025
 """
 
 import logging
+import math
+from functools import lru_cache
+from typing import overload
 
 import librosa
+import numba
 import numpy as np
 import pyloudnorm as pyln
+import scipy.signal
 
 from ..settings import get_settings
 
@@ -20,6 +25,159 @@ settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# Absolute gating threshold defined by ITU-R BS.1770.
+LUFS_ABSOLUTE_GATE = -70.0
+
+# STFT geometry of the onset envelope (librosa's onset_strength defaults).
+_FLUX_N_FFT = 2048
+_FLUX_HOP_LENGTH = 512
+
+
+@lru_cache(maxsize=8)
+def _k_weighting_sos(sample_rate: float) -> np.ndarray:
+    """
+    Designs the ITU-R BS.1770 K-weighting pre-filter as second-order sections.
+
+    The shelf and high-pass stages are derived from the analog parameters behind
+    the standard's coefficient table, so any sample rate is supported and 48 kHz
+    reproduces the published coefficients exactly.
+
+    :param sample_rate: The sample rate of the signal.
+    :return: A (2, 6) SOS array: [high shelf, high pass].
+    """
+    # Stage 1: high shelf (head acoustics).
+    k = math.tan(math.pi * 1681.974450955533 / sample_rate)
+    q = 0.7071752369554196
+    vh = 10 ** (3.999843853973347 / 20)
+    vb = vh**0.4996667741545416
+    a0 = 1 + k / q + k * k
+    shelf = [
+        (vh + vb * k / q + k * k) / a0,
+        2 * (k * k - vh) / a0,
+        (vh - vb * k / q + k * k) / a0,
+        1.0,
+        2 * (k * k - 1) / a0,
+        (1 - k / q + k * k) / a0,
+    ]
+
+    # Stage 2: RLB high pass.
+    k = math.tan(math.pi * 38.13547087602444 / sample_rate)
+    q = 0.5003270373238773
+    a0 = 1 + k / q + k * k
+    high_pass = [1.0, -2.0, 1.0, 1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0]
+
+    return np.array([shelf, high_pass])
+
+
+@lru_cache(maxsize=8)
+def _mel_basis(sample_rate: float, n_fft: int) -> np.ndarray:
+    """
+    Builds the mel filter bank of the onset envelope, once per sample rate.
+
+    :param sample_rate: The sample rate of the signal.
+    :param n_fft: The FFT size of the STFT.
+    :return: A (mels, n_fft // 2 + 1) filter bank matrix.
+    """
+    return librosa.filters.mel(sr=sample_rate, n_fft=n_fft, fmax=0.5 * sample_rate)
+
+
+# The kernels below are compiled eagerly for these signatures when the module
+# is imported (or loaded from Numba's on-disk cache), so the consumer thread
+# never stalls on JIT compilation while processing its first chunks.
+@numba.njit(
+    ["void(float32[:, ::1], float32[::1])", "void(float64[:, ::1], float64[::1])"],
+    parallel=True,
+    fastmath=True,
+    cache=True,
+)
+def _spectral_flux(spec: np.ndarray, out: np.ndarray):
+    """
+    Half-wave rectified spectral difference, averaged over frequency bins.
+
+    Fuses the diff, rectification and mean into one pass, so no intermediate
+    (frames x bins) arrays are allocated. Frames are processed in parallel.
+
+    :param spec: A C-contiguous (frames, bins) spectrogram.
+    :param out: Output array; out[t] receives the flux between frames t and t + 1.
+    """
+    n_bins = spec.shape[1]
+    for t in numba.prange(out.shape[0]):
+        total = 0.0
+        for b in range(n_bins):
+            diff = spec[t + 1, b] - spec[t, b]
+            if diff > 0.0:
+                total += diff
+        out[t] = total / n_bins
+
+
+@numba.njit(
+    ["float64(float32[::1])", "float64(float64[::1])"],
+    fastmath=True,
+    cache=True,
+    error_model="numpy",
+)
+def _mean_square(samples: np.ndarray) -> float:
+    """
+    Mean of the squared samples in a single pass, without an `x**2` temporary.
+
+    Squares are accumulated in float64, so long float32 blocks keep full precision.
+
+    :param samples: A 1-D array of audio samples.
+    :return: The mean square (NaN for an empty array).
+    """
+    total = 0.0
+    for i in range(samples.shape[0]):
+        sample = np.float64(samples[i])
+        total += sample * sample
+    return total / samples.shape[0]
+
+
+@numba.njit(
+    [
+        "UniTuple(float64, 2)(float32[::1], float64[:, ::1], float64[:, ::1])",
+        "UniTuple(float64, 2)(float64[::1], float64[:, ::1], float64[:, ::1])",
+    ],
+    cache=True,
+)
+def _stream_energy(samples: np.ndarray, sos: np.ndarray, zi: np.ndarray) -> tuple[float, float]:
+    """
+    Raw and K-weighted energy of a chunk in one pass over the samples.
+
+    Each sample is squared and run through the K-weighting biquad cascade
+    (transposed direct form II, as `scipy.signal.sosfilt`) while it is in a
+    register, so the chunk is read once and no filtered copy is allocated.
+
+    :param samples: A 1-D array of audio samples.
+    :param sos: The (sections, 6) second-order-sections filter.
+    :param zi: The (sections, 2) filter state, updated in place.
+    :return: A tuple (sum of squares, sum of squares of the K-weighted samples).
+    """
+    sum_squares = 0.0
+    k_sum_squares = 0.0
+    for i in range(samples.shape[0]):
+        x = np.float64(samples[i])
+        sum_squares += x * x
+        for s in range(sos.shape[0]):
+            y = sos[s, 0] * x + zi[s, 0]
+            zi[s, 0] = sos[s, 1] * x - sos[s, 4] * y + zi[s, 1]
+            zi[s, 1] = sos[s, 2] * x - sos[s, 5] * y
+            x = y
+        k_sum_squares += x * x
+    return sum_squares, k_sum_squares
+
+
+def _as_kernel_samples(audio_chunk: np.ndarray) -> np.ndarray:
+    """
+    Presents audio as the flat, contiguous float32/float64 array the kernels are compiled for.
+
+    :param audio_chunk: A numpy array (or array-like) of audio samples.
+    :return: A 1-D C-contiguous float array; a view when no conversion is needed.
+    """
+    samples = np.ascontiguousarray(audio_chunk).reshape(-1)
+    if samples.dtype != np.float32 and samples.dtype != np.float64:
+        samples = samples.astype(np.float64)
+    return samples
+
 
 class AudioMetrics:
     """A class to handle audio metric calculations."""
@@ -31,8 +189,14 @@ class AudioMetrics:
         :param sample_rate: The sample rate of the audio to be processed (e.g., 48.000 Hz).
         """
         self._lufs_meter = pyln.Meter(sample_rate)
-        self._lufs_chunks: list[np.ndarray] = []
         self._lufs_block_size = int(settings.AUDIO.LUFS_WINDOW_SECONDS * sample_rate)
+        # Aggregated samples live in one contiguous buffer sized for a LUFS window.
+        self._lufs_buffer = np.empty(self._lufs_block_size, dtype=np.float32)
+        self._lufs_write_index = 0
+
+        self._k_sos = _k_weighting_sos(sample_rate)
+        # Filter state carried between calls of stream_energy (streaming use).
+        self._k_zi = np.zeros((len(self._k_sos), 2))
 
     @staticmethod
     def rms(audio_chunk: np.ndarray) -> float:
@@ -43,7 +207,7 @@ class AudioMetrics:
         :param audio_chunk: A numpy array of audio samples.
         :return: The calculated RMS value as a float.
         """
-        return np.sqrt(np.mean(audio_chunk**2))
+        return math.sqrt(_mean_square(_as_kernel_samples(audio_chunk)))
 
     @staticmethod
     def flux(audio_chunk: np.ndarray, sample_rate: float) -> float:
@@ -63,8 +227,55 @@ class AudioMetrics:
         :param sample_rate: The sample rate of the audio chunk.
         :return: A single float representing the maximum spectral flux detected within the chunk.
         """
-        onset_env = librosa.onset.onset_strength(y=np.squeeze(audio_chunk), sr=sample_rate)
-        flux = np.max(onset_env)
+        onset_env = AudioMetrics._onset_envelope(audio_chunk, sample_rate)
+        return float(onset_env.max()) if len(onset_env) else 0.0
+
+    @staticmethod
+    def _onset_envelope(audio_data: np.ndarray, sample_rate: float) -> np.ndarray:
+        """
+        Computes the onset strength envelope of a signal, one value per STFT frame.
+
+        Matches librosa's `onset_strength` (log-mel power, lag-1 half-wave
+        rectified difference averaged over bands), but reuses a cached mel
+        filter bank and runs the difference step in Numba (`_spectral_flux`).
+
+        :param audio_data: A numpy array of audio samples.
+        :param sample_rate: The sample rate of the signal.
+        :return: The onset envelope, aligned to the centered STFT frames.
+        """
+        stft = librosa.stft(np.squeeze(audio_data), n_fft=_FLUX_N_FFT, hop_length=_FLUX_HOP_LENGTH, pad_mode="constant")
+        power = np.abs(stft) ** 2
+        spec = np.ascontiguousarray(librosa.power_to_db(_mel_basis(sample_rate, _FLUX_N_FFT) @ power).T)
+
+        # Same alignment as onset_strength: the lag-1 difference is delayed by
+        # the centering offset of the STFT, and the leading frames stay zero.
+        pad_width = 1 + _FLUX_N_FFT // (2 * _FLUX_HOP_LENGTH)
+        onset_env = np.zeros(len(spec), dtype=spec.dtype)
+        if len(spec) > pad_width:
+            _spectral_flux(spec, onset_env[pad_width:])
+        return onset_env
+
+    @staticmethod
+    def flux_series(audio_data: np.ndarray, sample_rate: float, chunk_size: int) -> np.ndarray:
+        """
+        Calculates the peak spectral flux of every consecutive chunk of a signal.
+
+        Equivalent to calling `flux` on each chunk, but the onset envelope is
+        computed with a single STFT over the whole signal and then reduced per
+        chunk, which also avoids the zero-padding artefacts at chunk edges.
+
+        :param audio_data: A numpy array holding the full signal.
+        :param sample_rate: The sample rate of the signal.
+        :param chunk_size: The number of samples per analysis chunk.
+        :return: A float32 array with the maximum spectral flux of each chunk.
+        """
+        total_chunks = len(audio_data) // chunk_size
+        onset_env = AudioMetrics._onset_envelope(audio_data[: total_chunks * chunk_size], sample_rate)
+
+        # Assign each envelope frame to the chunk holding its center sample.
+        frame_chunks = np.minimum(np.arange(len(onset_env)) * _FLUX_HOP_LENGTH // chunk_size, total_chunks - 1)
+        flux = np.zeros(total_chunks, dtype=np.float32)
+        np.maximum.at(flux, frame_chunks, onset_env)
         return flux
 
     @staticmethod
@@ -80,14 +291,42 @@ class AudioMetrics:
         :param audio_chunk: A numpy array of audio samples.
         :return: The calculated dBFS value.
         """
-        rms = AudioMetrics.rms(audio_chunk)
+        return AudioMetrics.rms_to_dBFS(AudioMetrics.rms(audio_chunk))
+
+    @overload
+    @staticmethod
+    def rms_to_dBFS(rms: float) -> float: ...
+
+    @overload
+    @staticmethod
+    def rms_to_dBFS(rms: np.ndarray) -> np.ndarray: ...
+
+    @staticmethod
+    def rms_to_dBFS(rms):
+        """
+        Converts an RMS value (or an array of RMS values) to dBFS.
+
+        Works element-wise on arrays, so a whole series of per-chunk RMS values
+        can be converted in a single vectorized pass.
+
+        :param rms: A single RMS value or a numpy array of RMS values.
+        :return: The dBFS value(s), clipped at the configured lower bound.
+        """
         epsilon = 1e-10
         dbfs = 20 * np.log10(rms + epsilon)
 
-        return dbfs if dbfs > settings.METRICS.DBFS_LOWER_BOUND else settings.METRICS.DBFS_LOWER_BOUND
+        return np.maximum(dbfs, settings.METRICS.DBFS_LOWER_BOUND)
+
+    @overload
+    @staticmethod
+    def dBSPL(dbfs_level: float, sensitivity_dbfs: float, reference_dbspl: float) -> float: ...
 
+    @overload
     @staticmethod
-    def dBSPL(dbfs_level: float, sensitivity_dbfs: float, reference_dbspl: float) -> float:
+    def dBSPL(dbfs_level: np.ndarray, sensitivity_dbfs: float, reference_dbspl: float) -> np.ndarray: ...
+
+    @staticmethod
+    def dBSPL(dbfs_level, sensitivity_dbfs, reference_dbspl):
         """
         Converts a dBFS level to Decibels Sound Pressure Level (dBSPL) using microphone sensitivity.
 
@@ -97,7 +336,7 @@ class AudioMetrics:
 
         The formula applied is: dBSPL = dBFS_calibrated - Sensitivity_dBFS + Reference_dBSPL
 
-        :param dbfs_level: The input audio level expressed in dBFS. For accurate dBSPL
+        :param dbfs_level: The input audio level expressed in dBFS (or an array of levels). For accurate dBSPL
                            results across all frequencies, this value should have been calculated
                            from an audio signal that was *already processed* by a frequency
                            response correction filter (e.g., the FIR filter).
@@ -117,20 +356,34 @@ class AudioMetrics:
         """
         Adds an audio chunk to the internal buffer for later LUFS calculation.
 
+        The samples are copied into a preallocated contiguous float32 buffer,
+        which doubles in size if an interval collects more than it holds.
+
         :param audio_chunk: A numpy array of audio samples.
         """
-        self._lufs_chunks.append(audio_chunk)
-
-    def get_lufs_chunks(self) -> list[np.ndarray]:
+        start = self._lufs_write_index
+        end = start + len(audio_chunk)
+        if end > len(self._lufs_buffer):
+            grown = np.empty(max(end, 2 * len(self._lufs_buffer)), dtype=np.float32)
+            grown[:start] = self._lufs_buffer[:start]
+            self._lufs_buffer = grown
+        self._lufs_buffer[start:end] = audio_chunk
+        self._lufs_write_index = end
+
+    def get_lufs_chunks(self) -> np.ndarray:
         """
-        Retrieves and clears the buffered audio chunks. This is used by a
+        Retrieves and clears the buffered audio. This is used by a
         monitoring loop to get the collected data for a processing interval.
 
-        :return: A list of the buffered numpy arrays.
+        The samples are returned as a view of the internal buffer, without a
+        copy, so they are only valid until the next `aggregate_lufs_chunks`
+        call; callers that keep them longer must copy them.
+
+        :return: A contiguous float32 array with all samples aggregated since the last call.
         """
-        chunks = self._lufs_chunks[:]
-        self._lufs_chunks.clear()
-        return chunks
+        samples = self._lufs_buffer[: self._lufs_write_index]
+        self._lufs_write_index = 0
+        return samples
 
     def lufs(self, audio_chunk: np.ndarray) -> float:
         """
@@ -147,6 +400,69 @@ class AudioMetrics:
         loudness = self._lufs_meter.integrated_loudness(audio_chunk)
         return loudness if loudness > settings.METRICS.LUFS_LOWER_BOUND else settings.METRICS.LUFS_LOWER_BOUND
 
+    def k_weighting(self, audio_chunk: np.ndarray) -> np.ndarray:
+        """
+        Applies the ITU-R BS.1770 K-weighting pre-filter (high shelf + high pass).
+
+        Filtering a whole signal once lets callers derive the loudness of any
+        window from the weighted power, instead of re-filtering overlapping windows.
+
+        :param audio_chunk: A numpy array of audio samples.
+        :return: The K-weighted audio samples.
+        """
+        return scipy.signal.sosfilt(self._k_sos, audio_chunk)
+
+    def stream_energy(self, audio_chunk: np.ndarray) -> tuple[float, float]:
+        """
+        Returns the raw and the K-weighted energy of the next chunk of a continuous stream.
+
+        Both sums come from a single compiled pass (`_stream_energy`). The
+        K-weighting filter state is kept between calls, so feeding consecutive
+        chunks gives the same result as filtering the whole stream at once.
+        Summing each value over an interval and dividing by its sample count
+        yields the mean squares behind the RMS and `mean_square_to_lufs`.
+
+        :param audio_chunk: The next numpy array of samples of the stream.
+        :return: A tuple (sum of squares, sum of squares of the K-weighted chunk).
+        """
+        return _stream_energy(_as_kernel_samples(audio_chunk), self._k_sos, self._k_zi)
+
+    @overload
+    @staticmethod
+    def mean_square_to_lufs(mean_square: float) -> float: ...
+
+    @overload
+    @staticmethod
+    def mean_square_to_lufs(mean_square: np.ndarray) -> np.ndarray: ...
+
+    @staticmethod
+    def mean_square_to_lufs(mean_square):
+        """
+        Converts the mean square of a K-weighted signal to loudness (LUFS).
+
+        Applies the BS.1770 formula (-0.691 + 10 * log10(z)) element-wise. Values
+        below the -70 LUFS absolute gate are reported at the configured lower bound,
+        matching what the gated LUFS meter returns for near-silent audio.
+
+        :param mean_square: A single mean square value or a numpy array of them.
+        :return: The loudness value(s) in LUFS (a float for scalar input).
+        """
+        loudness = -0.691 + 10 * np.log10(np.maximum(mean_square, 1e-12))
+        gated = np.where(loudness > LUFS_ABSOLUTE_GATE, loudness, settings.METRICS.LUFS_LOWER_BOUND)
+        # np.where returns a 0-d array for a scalar; unwrap it so scalar callers get a float.
+        return float(gated) if np.ndim(mean_square) == 0 else gated
+
+    @staticmethod
+    def metrics_logging_enabled() -> bool:
+        """
+        Tells whether `show_metrics` output would be emitted at the current log level.
+
+        Lets callers skip computing metrics that nobody will see.
+
+        :return: True if the metrics logger is enabled for INFO.
+        """
+        return logger.isEnabledFor(logging.INFO)
+
     @staticmethod
     def show_metrics(**metrics: float):
         """
@@ -157,6 +473,8 @@ class AudioMetrics:
 
         :param metrics: A variable number of keyword arguments (e.g., rms=0.1, dbfs=-25.3).
         """
+        if not AudioMetrics.metrics_logging_enabled():
+            return
 
         formatted_metrics = {key: f"{value:.4f}" for key, value in metrics.items() if key != "measured_at"}
         measured_at = metrics["measured_at"]
@@ -71,6 +71,9 @@ class Settings(BaseSettings):
     RECONNECT_DELAY_SECONDS: int = 5
     RECONNECT_MAX_RETRIES: int = 10
     CONSUMER_QUEUE_TIMEOUT_SECONDS: int = 1
+    CONSUMER_MAX_BATCH_CHUNKS: int = 8
+    AUDIO_QUEUE_MAX_CHUNKS: int = 64
+    AUDIO_BUFFER_POOL_SIZE: int = 4
 
 
 @lru_cache
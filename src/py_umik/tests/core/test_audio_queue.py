@@ -0,0 +1,72 @@
+"""
+Unit tests for AudioQueue.
+
+Author: Daniel Collier
+GitHub: https://github.com/danielfcollier
+Year: 2025
+"""
+
+import queue
+import threading
+
+import pytest
+
+from py_umik.core.audio_queue import AudioQueue
+
+
+def test_items_are_returned_in_order():
+    """Test FIFO ordering of queued items."""
+    q = AudioQueue(maxlen=4)
+    q.put_nowait("a")
+    q.put_nowait("b")
+
+    assert q.get(timeout=0.1) == "a"
+    assert q.get(timeout=0.1) == "b"
+    assert len(q) == 0
+
+
+def test_full_queue_drops_oldest():
+    """Test that a full queue evicts the oldest item instead of raising."""
+    q = AudioQueue(maxlen=2)
+    for item in ("a", "b", "c"):
+        q.put_nowait(item)
+
+    assert len(q) == 2
+    assert q.get(timeout=0.1) == "b"
+    assert q.get(timeout=0.1) == "c"
+
+
+def test_get_times_out_when_empty():
+    """Test that get raises queue.Empty after the timeout."""
+    q = AudioQueue(maxlen=2)
+
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.01)
+
+
+def test_get_wakes_up_on_put():
+    """Test that a blocked get returns as soon as the producer puts an item."""
+    q = AudioQueue(maxlen=2)
+    timer = threading.Timer(0.05, q.put_nowait, args=("late",))
+    timer.start()
+
+    assert q.get(timeout=2.0) == "late"
+    timer.join()
+
+
+def test_producer_hands_over_many_items_across_threads():
+    """Test that a fast producer never loses a wake-up or an item."""
+    q = AudioQueue(maxlen=10_000)
+    received: list = []
+
+    def consume():
+        while len(received) < 5_000:
+            received.append(q.get(timeout=1.0))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for i in range(5_000):
+        q.put_nowait(i)
+    consumer.join(timeout=5.0)
+
+    assert received == list(range(5_000))
@@ -17,6 +17,8 @@ from py_umik.core.base_app import BaseApp
 def mock_dependencies():
     """Return mocks for config and pipeline."""
     config = MagicMock()
+    config.block_size = 1024
+    config.dtype = "float32"
     pipeline = MagicMock()
     return config, pipeline
 
@@ -47,6 +49,7 @@ def test_app_initialization_and_thread_setup(mock_listener_cls, mock_consumer_cl
         audio_device_config=audio_config,
         audio_queue=app._queue,
         stop_event=app._stop_event,
+        buffer_pool=app._buffer_pool,
     )
 
     # Assert Consumer Thread Creation
@@ -55,6 +58,8 @@ def test_app_initialization_and_thread_setup(mock_listener_cls, mock_consumer_cl
         stop_event=app._stop_event,
         pipeline=pipeline,
         consumer_queue_timeout_seconds=1,
+        buffer_pool=app._buffer_pool,
+        max_batch_chunks=8,
     )
 
     # Assert Threads were added to the internal list
@@ -0,0 +1,44 @@
+"""
+Unit tests for AudioBufferPool.
+
+Author: Daniel Collier
+GitHub: https://github.com/danielfcollier
+Year: 2025
+"""
+
+import numpy as np
+
+from py_umik.core.buffer_pool import AudioBufferPool
+
+
+def test_released_buffers_are_reused():
+    """Test that a released buffer is handed out again by acquire."""
+    pool = AudioBufferPool(block_size=16, dtype="float32", size=2)
+
+    buffer = pool.acquire()
+    assert buffer.shape == (16,)
+    assert buffer.dtype == np.float32
+
+    pool.release(buffer)
+    assert pool.acquire() is buffer
+
+
+def test_exhausted_pool_allocates():
+    """Test that acquire still returns buffers when the pool is empty."""
+    pool = AudioBufferPool(block_size=8, dtype="float32", size=1)
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert first is not second
+    assert second.shape == (8,)
+
+
+def test_foreign_buffers_are_not_pooled():
+    """Test that buffers of another shape are not added to the pool."""
+    pool = AudioBufferPool(block_size=8, dtype="float32", size=1)
+    pool.acquire()
+
+    pool.release(np.empty(4, dtype=np.float32))
+
+    assert pool.acquire().shape == (8,)
@@ -10,6 +10,7 @@ import queue
 import threading
 from unittest.mock import MagicMock
 
+from py_umik.core.audio_queue import AudioQueue
 from py_umik.core.consumer_thread import ConsumerThread
 
 
@@ -78,3 +79,20 @@ def test_consumer_handles_pipeline_error():
     consumer.run()
 
     # Should have logged error but not crashed (implied by reaching here)
+
+
+def test_consumer_drains_backlog_as_batch():
+    """Test that queued chunks are drained and executed as a single batch."""
+    audio_queue = AudioQueue(maxlen=8)
+    mock_pipeline = MagicMock()
+    stop_event = threading.Event()
+    for i in range(3):
+        audio_queue.put_nowait((f"chunk{i}", f"ts{i}"))
+
+    consumer = ConsumerThread(audio_queue, stop_event, mock_pipeline, 0.01, max_batch_chunks=2)
+    mock_pipeline.execute.side_effect = lambda *args: stop_event.set()
+    consumer.run()
+
+    # First run: two chunks batched with their timestamps; then the last one alone
+    mock_pipeline.execute_batch.assert_called_once_with(["chunk0", "chunk1"], ["ts0", "ts1"])
+    mock_pipeline.execute.assert_called_once_with("chunk2", "ts2")
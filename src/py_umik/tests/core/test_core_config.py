@@ -7,12 +7,14 @@ Year: 2025
 """
 
 import argparse
+import dataclasses
 import os
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-from py_umik.core.config import AppArgs
+from py_umik.core.config import AppArgs, AppConfig, refresh_settings
+from py_umik.hardware.selector import HardwareSelector
 from py_umik.settings import get_settings
 
 settings = get_settings()
@@ -36,6 +38,7 @@ def test_validate_args_adjusts_buffer(mock_hardware_selector):
     # Force settings for predictable logic
     settings.AUDIO.MIN_BUFFER_SECONDS = 3.0
     settings.AUDIO.LUFS_WINDOW_SECONDS = 3
+    refresh_settings()
 
     # Request too small buffer (1s)
     args = argparse.Namespace(
@@ -57,6 +60,7 @@ def test_validate_args_adjusts_buffer_rounding(mock_hardware_selector):
     """Test that buffer is rounded up to match LUFS window."""
     settings.AUDIO.MIN_BUFFER_SECONDS = 3.0
     settings.AUDIO.LUFS_WINDOW_SECONDS = 3
+    refresh_settings()
 
     # Request 4s buffer (not divisible by 3)
     args = argparse.Namespace(
@@ -74,6 +78,26 @@ def test_validate_args_adjusts_buffer_rounding(mock_hardware_selector):
     assert config.buffer_seconds == 6.0
 
 
+def test_validate_args_ignores_float_noise_in_buffer(mock_hardware_selector):
+    """A buffer that is a multiple of the LUFS window up to float noise is not rounded up."""
+    settings.AUDIO.MIN_BUFFER_SECONDS = 3.0
+    settings.AUDIO.LUFS_WINDOW_SECONDS = 3
+    refresh_settings()
+
+    args = argparse.Namespace(
+        device_id=None,
+        buffer_seconds=6.0000000001,
+        sample_rate=48000,
+        calibration_file=None,
+        num_taps=1024,
+        default=False,
+    )
+
+    config = AppArgs.validate_args(args)
+
+    assert config.buffer_seconds == pytest.approx(6.0)
+
+
 @patch("py_umik.core.config.HardwareCalibrator")
 def test_validate_args_with_calibration(mock_calibrator_cls, mock_hardware_selector):
     """Test valid configuration with a non-default device and calibration file."""
@@ -100,6 +124,31 @@ def test_validate_args_with_calibration(mock_calibrator_cls, mock_hardware_selec
     assert config.sensitivity_dbfs == -18.0
     assert config.num_taps == 512
 
+    # The FIR filter is not designed until the factory is called.
+    mock_calibrator_cls.assert_not_called()
+    config.audio_calibrator()
+    mock_calibrator_cls.assert_called_once_with(
+        calibration_file_path="/path/to/cal.txt", sample_rate=48000, num_taps=512
+    )
+
+
+def test_validate_args_rejects_malformed_calibration_table_at_startup(mock_hardware_selector, tmp_path):
+    """Test that a calibration file without a frequency table fails during validation, not in the pipeline."""
+    cal_file = tmp_path / "bad_cal.txt"
+    cal_file.write_text('"Sens Factor =-1.5dB, SERNO: 7000000"\nnot a table\n', encoding="utf-8")
+
+    args = argparse.Namespace(
+        device_id=1,
+        buffer_seconds=6.0,
+        sample_rate=48000,
+        calibration_file=str(cal_file),
+        num_taps=512,
+        default=False,
+    )
+
+    with pytest.raises(SystemExit):
+        AppArgs.validate_args(args)
+
 
 @patch.dict(os.environ, {"CALIBRATION_FILE": ""})
 def test_no_calibration_file_allows_uncalibrated_setup(mock_hardware_selector):
@@ -125,3 +174,52 @@ def test_no_calibration_file_allows_uncalibrated_setup(mock_hardware_selector):
     # ASSERT: Calibration is disabled (None), but the device ID is still respected
     assert config.audio_calibrator is None
     assert config.audio_device.id == mock_hardware_selector.return_value.id
+
+
+@patch.dict(os.environ, {"CALIBRATION_FILE": "/env/cal.txt"})
+@patch("py_umik.core.config.HardwareCalibrator")
+def test_validate_args_uses_env_calibration_file(mock_calibrator_cls, mock_hardware_selector):
+    """The CALIBRATION_FILE env var enables calibration and UMIK-1 auto-detection."""
+    mock_calibrator_cls.get_sensitivity_values.return_value = (-18.0, 94.0)
+    mock_hardware_selector.find_device_by_name.return_value = 7
+
+    args = argparse.Namespace(
+        device_id=None,
+        buffer_seconds=6.0,
+        sample_rate=48000,
+        calibration_file=None,
+        num_taps=512,
+        default=False,
+    )
+
+    config = AppArgs.validate_args(args)
+
+    mock_calibrator_cls.get_sensitivity_values.assert_called_once_with("/env/cal.txt")
+    mock_hardware_selector.assert_called_once_with(target_id=7)
+    assert config.audio_calibrator is not None
+
+
+@patch("sys.argv", ["app", "--device-id", "3"])
+def test_get_args_parses_once():
+    """Test that get_args parses sys.argv once and returns the cached Namespace."""
+    AppArgs.get_args.cache_clear()
+
+    with patch.object(AppArgs, "get_parser", wraps=AppArgs.get_parser) as mock_get_parser:
+        first = AppArgs.get_args()
+        second = AppArgs.get_args()
+
+    assert first is second
+    assert first.device_id == 3
+    mock_get_parser.assert_called_once()
+    AppArgs.get_args.cache_clear()
+
+
+def test_app_config_is_frozen_with_slots():
+    """Test that AppConfig defaults optional fields and rejects mutation."""
+    config = AppConfig(audio_device=Mock(spec=HardwareSelector), sample_rate=48000.0, buffer_seconds=6.0)
+
+    assert config.audio_calibrator is None
+    assert config.num_taps is None
+    assert not hasattr(config, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(config, "sample_rate", 44100.0)
@@ -12,13 +12,25 @@ from unittest.mock import patch
 from py_umik.core.datetime_stamp import DatetimeStamp
 
 
-def test_get_timestamp_format():
-    """Verify that the timestamp follows 'YYYY-MM-DD HH:MM:SS' format."""
-    # Mock a fixed datetime
+def test_get_returns_nanoseconds():
+    """Verify that get() returns the wall clock as integer nanoseconds."""
+    with patch("py_umik.core.datetime_stamp.time.time_ns", return_value=1_735_732_800_000_000_000):
+        timestamp = DatetimeStamp.get()
+
+    assert isinstance(timestamp, int)
+    assert timestamp == 1_735_732_800_000_000_000
+
+
+def test_to_datetime_round_trip():
+    """Verify that a nanosecond timestamp converts back to the same local datetime."""
     fixed_date = datetime(2025, 1, 1, 12, 0, 0)
+    timestamp_ns = int(fixed_date.timestamp()) * 1_000_000_000
 
-    with patch("py_umik.core.datetime_stamp.datetime") as mock_datetime:
-        mock_datetime.now.return_value = fixed_date
+    assert DatetimeStamp.to_datetime(timestamp_ns) == fixed_date
 
-        timestamp = DatetimeStamp.get()
-        assert timestamp == "2025-01-01 12:00:00"
+
+def test_format_timestamp():
+    """Verify that the formatted timestamp follows 'YYYY-MM-DD HH:MM:SS' format."""
+    timestamp_ns = int(datetime(2025, 1, 1, 12, 0, 0).timestamp()) * 1_000_000_000
+
+    assert DatetimeStamp.format(timestamp_ns) == "2025-01-01 12:00:00"
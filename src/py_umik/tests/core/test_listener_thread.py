@@ -9,6 +9,7 @@ Year: 2025
 import threading
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 import sounddevice as sd
 
@@ -21,6 +22,7 @@ def mock_deps():
     config.id = 1
     config.sample_rate = 48000
     config.block_size = 1024
+    config.listener_core = None
 
     q = MagicMock()
     stop = threading.Event()
@@ -28,31 +30,51 @@ def mock_deps():
 
 
 def test_listener_normal_read(mock_deps):
-    """Test normal reading from stream."""
+    """Test that the stream is opened with the audio callback and closed on stop."""
     config, q, stop = mock_deps
     listener = ListenerThread(config, q, stop)
 
-    # Mock Stream
     with patch("sounddevice.InputStream") as mock_stream_cls:
-        # Get the instance returned by the context manager
-        mock_stream = mock_stream_cls.return_value.__enter__.return_value
+        # Stop as soon as the stream is opened
+        mock_stream_cls.return_value.__enter__.side_effect = lambda: stop.set()
 
-        # Setup read to return data then stop
-        fake_data = MagicMock()
-        fake_data.ndim = 2
-        fake_data.flatten.return_value = fake_data  # simplfy
+        listener.run()
 
-        # Define side effect to stop the loop after one read
-        def stop_side_effect(*args):
-            stop.set()
-            return (fake_data, False)  # (data, overflow)
+        kwargs = mock_stream_cls.call_args.kwargs
+        assert callable(kwargs["callback"])
+        assert kwargs["blocksize"] == 1024
 
-        mock_stream.read.side_effect = stop_side_effect
 
-        listener.run()
+def test_listener_callback_queues_mono_copy(mock_deps):
+    """Test that the callback copies the mono column onto the queue."""
+    config, q, stop = mock_deps
+    listener = ListenerThread(config, q, stop)
+
+    indata = np.arange(4, dtype=np.float32).reshape(4, 1)
+    listener._make_audio_callback()(indata, 4, None, MagicMock(input_overflow=False))
+
+    audio_chunk, _ = q.put_nowait.call_args.args[0]
+    assert audio_chunk.shape == (4,)
+    assert not np.shares_memory(audio_chunk, indata)
+    np.testing.assert_array_equal(audio_chunk, [0, 1, 2, 3])
+
 
-        # Verify put was called
-        q.put_nowait.assert_called()
+@patch("os.sched_setaffinity", create=True)
+def test_listener_callback_pins_capture_thread_once(mock_setaffinity, mock_deps):
+    """Test that listener_core pins the callback thread on the first block only."""
+    config, q, stop = mock_deps
+    config.listener_core = 2
+    listener = ListenerThread(config, q, stop)
+
+    callback = listener._make_audio_callback()
+    mock_setaffinity.assert_not_called()
+
+    indata = np.zeros((4, 1), dtype=np.float32)
+    for _ in range(3):
+        callback(indata, 4, None, MagicMock(input_overflow=False))
+
+    mock_setaffinity.assert_called_once_with(0, {2})
+    assert q.put_nowait.call_count == 3
 
 
 def test_listener_reconnects_on_error(mock_deps):
@@ -67,10 +89,8 @@ def test_listener_reconnects_on_error(mock_deps):
         # 1. Create the mock for the successful attempt separately
         success_stream_mock = MagicMock()
 
-        # 2. Configure the successful stream to break the loop immediately
-        valid_stream_instance = success_stream_mock.__enter__.return_value
-        # When read() is called: set stop event, then return dummy data
-        valid_stream_instance.read.side_effect = lambda x: stop.set() or (MagicMock(), False)
+        # 2. Configure the successful stream to stop the app once it is opened
+        success_stream_mock.__enter__.side_effect = lambda: stop.set()
 
         # 3. Assign side_effect with the Error first, then the Configured Mock
         mock_stream_cls.side_effect = [
@@ -82,3 +102,45 @@ def test_listener_reconnects_on_error(mock_deps):
 
         # Check that we tried twice (First failed, Second succeeded)
         assert mock_stream_cls.call_count == 2
+
+
+def test_listener_propagates_unexpected_errors(mock_deps):
+    """Test that non-hardware errors are not retried but left to the thread guard."""
+    config, q, stop = mock_deps
+    listener = ListenerThread(config, q, stop)
+
+    with patch("sounddevice.InputStream", side_effect=ValueError("bad parameter")) as mock_stream_cls:
+        with pytest.raises(ValueError, match="bad parameter"):
+            listener.run()
+
+        assert mock_stream_cls.call_count == 1
+
+
+def test_listener_callback_uses_buffer_pool(mock_deps):
+    """Test that the callback fills a pooled buffer when a pool is given."""
+    config, q, stop = mock_deps
+    pool = MagicMock()
+    pooled = np.empty(1024, dtype=np.float32)
+    pool.acquire.return_value = pooled
+    listener = ListenerThread(config, q, stop, buffer_pool=pool)
+
+    indata = np.ones((1024, 1), dtype=np.float32)
+    listener._make_audio_callback()(indata, 1024, None, MagicMock(input_overflow=False))
+
+    audio_chunk, _ = q.put_nowait.call_args.args[0]
+    assert audio_chunk is pooled
+    np.testing.assert_array_equal(audio_chunk, 1.0)
+
+
+def test_listener_pooled_callback_copies_short_blocks(mock_deps):
+    """Test that a block shorter than the pool's buffers bypasses the pool."""
+    config, q, stop = mock_deps
+    pool = MagicMock()
+    listener = ListenerThread(config, q, stop, buffer_pool=pool)
+
+    indata = np.ones((16, 1), dtype=np.float32)
+    listener._make_audio_callback()(indata, 16, None, MagicMock(input_overflow=False))
+
+    audio_chunk, _ = q.put_nowait.call_args.args[0]
+    pool.acquire.assert_not_called()
+    assert audio_chunk.shape == (16,)
@@ -6,11 +6,11 @@ GitHub: https://github.com/danielfcollier
 Year: 2025
 """
 
-from datetime import datetime
 from unittest.mock import Mock
 
 import numpy as np
 
+from py_umik.core.datetime_stamp import DatetimeStamp
 from py_umik.core.interfaces import AudioSink, AudioTransformer
 from py_umik.core.pipeline import AudioPipeline
 
@@ -35,7 +35,7 @@ def test_pipeline_execution():
 
     # --- Execute ---
     original_audio = np.array([1.0, 2.0])
-    timestamp = datetime.now()
+    timestamp = DatetimeStamp.get()
 
     pipeline.execute(original_audio, timestamp)
 
@@ -53,3 +53,73 @@ def test_pipeline_execution():
 
     # Check AudioSink 2
     sink2.handle_audio.assert_called_once()
+
+
+def test_pipeline_recompiles_after_changes():
+    """Verify that components added after a run are part of the next execution."""
+    pipeline = AudioPipeline()
+    sink1 = Mock(spec=AudioSink)
+    pipeline.add_sink(sink1)
+
+    pipeline.execute(np.array([1.0]), DatetimeStamp.get())
+
+    processor = Mock(spec=AudioTransformer)
+    processor.process_audio.side_effect = lambda x: x + 1
+    sink2 = Mock(spec=AudioSink)
+    pipeline.add_transformer(processor)
+    pipeline.add_sink(sink2)
+
+    pipeline.execute(np.array([1.0]), DatetimeStamp.get())
+
+    assert sink1.handle_audio.call_count == 2
+    assert np.array_equal(sink2.handle_audio.call_args[0][0], np.array([2.0]))
+
+
+def test_pipeline_execute_batch_delivers_chunks_individually():
+    """Verify that a batch is transformed at once but reaches sinks chunk by chunk."""
+    pipeline = AudioPipeline()
+    processor = Mock(spec=["process_audio_batch", "process_audio"])
+    processor.process_audio_batch.side_effect = lambda batch: batch * 2
+    sink = Mock(spec=AudioSink)
+    pipeline.add_transformer(processor)
+    pipeline.add_sink(sink)
+
+    pipeline.execute_batch([np.array([1.0, 2.0]), np.array([3.0, 4.0])], [10, 20])
+
+    processor.process_audio_batch.assert_called_once()
+    processor.process_audio.assert_not_called()
+    assert processor.process_audio_batch.call_args[0][0].shape == (2, 2)
+    assert sink.handle_audio.call_count == 2
+    first, second = sink.handle_audio.call_args_list
+    assert np.array_equal(first[0][0], [2.0, 4.0]) and first[0][1] == 10
+    assert np.array_equal(second[0][0], [6.0, 8.0]) and second[0][1] == 20
+
+
+def test_pipeline_execute_batch_without_batch_method():
+    """Verify that transformers without process_audio_batch see the batch as one block."""
+    pipeline = AudioPipeline()
+    processor = Mock(spec=["process_audio"])
+    processor.process_audio.side_effect = lambda chunk: chunk + 1
+    sink = Mock(spec=AudioSink)
+    pipeline.add_transformer(processor)
+    pipeline.add_sink(sink)
+
+    pipeline.execute_batch([np.array([1.0, 2.0]), np.array([3.0, 4.0])], [10, 20])
+
+    processor.process_audio.assert_called_once()
+    assert np.array_equal(processor.process_audio.call_args[0][0], [1.0, 2.0, 3.0, 4.0])
+    assert np.array_equal(sink.handle_audio.call_args_list[1][0][0], [4.0, 5.0])
+
+
+def test_pipeline_execute_batch_joins_ragged_chunks():
+    """Verify that chunks of different lengths reach the sinks as one continuous block."""
+    pipeline = AudioPipeline()
+    sink = Mock(spec=AudioSink)
+    pipeline.add_sink(sink)
+    timestamp = DatetimeStamp.get()
+
+    pipeline.execute_batch([np.array([1.0, 2.0]), np.array([3.0])], [timestamp, DatetimeStamp.get()])
+
+    sink.handle_audio.assert_called_once()
+    assert np.array_equal(sink.handle_audio.call_args[0][0], np.array([1.0, 2.0, 3.0]))
+    assert sink.handle_audio.call_args[0][1] == timestamp
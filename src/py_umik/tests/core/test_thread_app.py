@@ -78,3 +78,18 @@ def test_run_starts_threads(mock_signal):
 
     # Verify join called
     mock_thread.join.assert_called()
+
+
+@patch("os.sched_setaffinity", create=True)
+def test_pin_to_core_sets_affinity(mock_setaffinity):
+    """Test that _pin_to_core pins the calling thread before running the target."""
+    worker = MagicMock()
+
+    pinned = ThreadApp._pin_to_core(worker, 3)
+    pinned("arg")
+
+    mock_setaffinity.assert_called_once_with(0, {3})
+    worker.assert_called_once_with("arg")
+
+    # Without a core the target is returned untouched
+    assert ThreadApp._pin_to_core(worker, None) is worker
@@ -7,17 +7,23 @@ GitHub: https://github.com/danielfcollier
 Year: 2025
 """
 
+import os
 from unittest.mock import mock_open, patch
 
 import numpy as np
 import pytest
+from scipy.signal import lfilter
 
 from py_umik.hardware.cache_strategy import NoOpFilterCache
-from py_umik.hardware.calibrator import HardwareCalibrator
+from py_umik.hardware.calibrator import HardwareCalibrator, _design_correction_filter
 from py_umik.settings import get_settings
 
 settings = get_settings()
 
+# Test signals are drawn straight into float32 buffers (no float64 temporary + astype copy).
+_rng = np.random.default_rng(0)
+_test_buf = np.empty(4800, dtype=np.float32)
+
 
 DUMMY_CAL_DATA = """
 "Sens Factor" =-1.23dB, SERNO: 7000000
@@ -40,6 +46,14 @@ def mock_settings():
     settings.HARDWARE.REFERENCE_DBSPL = 94.0
 
 
+@pytest.fixture(autouse=True)
+def clear_design_cache():
+    """Start every test without in-process memoized filter designs."""
+    _design_correction_filter.cache_clear()
+    yield
+    _design_correction_filter.cache_clear()
+
+
 @pytest.fixture
 def mock_firwin2():
     """
@@ -88,6 +102,31 @@ def test_initialization_parses_file_and_designs_filter(mock_firwin2):
         # 4. Verify internal state is set
         assert calibrator._filter_taps is not None
         assert len(calibrator._filter_taps) == 1023
+        # Taps match the stream's precision so filtering never upcasts.
+        assert calibrator._filter_taps.dtype == np.float32
+        assert calibrator._filter_taps.flags.c_contiguous
+
+
+def test_filter_design_is_memoized_per_file_version(mock_firwin2, tmp_path):
+    """Repeated constructions reuse the design until the calibration file changes."""
+    cal_file = tmp_path / "cal.txt"
+    cal_file.write_text(DUMMY_CAL_DATA, encoding="utf-8")
+
+    for _ in range(2):
+        HardwareCalibrator(str(cal_file), sample_rate=48000, num_taps=64, cache_strategy=NoOpFilterCache())
+    assert mock_firwin2.call_count == 1
+
+    # A newer file version is a new cache key.
+    stat = cal_file.stat()
+    os.utime(cal_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    HardwareCalibrator(str(cal_file), sample_rate=48000, num_taps=64, cache_strategy=NoOpFilterCache())
+    assert mock_firwin2.call_count == 2
+
+    # force_write always redesigns.
+    HardwareCalibrator(
+        str(cal_file), sample_rate=48000, num_taps=64, force_write=True, cache_strategy=NoOpFilterCache()
+    )
+    assert mock_firwin2.call_count == 3
 
 
 def test_apply_maintains_shape(mock_firwin2):
@@ -104,8 +143,8 @@ def test_apply_maintains_shape(mock_firwin2):
         )
 
         # Create a dummy audio chunk (e.g., 100ms at 48k)
-        chunk_size = 4800
-        input_audio = np.random.uniform(-1.0, 1.0, chunk_size).astype(np.float32)
+        _rng.standard_normal(dtype=np.float32, out=_test_buf)
+        input_audio = _test_buf
 
         # Apply calibration
         output_audio = calibrator.apply(input_audio)
@@ -114,6 +153,48 @@ def test_apply_maintains_shape(mock_firwin2):
         assert isinstance(output_audio, np.ndarray)
         assert output_audio.shape == input_audio.shape
         assert output_audio.dtype == input_audio.dtype
+        # Taps and filter state stay in float32 (no float64 upcast)
+        assert calibrator._filter_taps.dtype == np.float32
+        assert calibrator._filter_state.dtype == np.float32
+
+
+def test_apply_is_continuous_across_chunks():
+    """
+    Verify that filtering chunk by chunk matches filtering the whole signal at once.
+    """
+    with patch("builtins.open", mock_open(read_data=DUMMY_CAL_DATA)):
+        calibrator = HardwareCalibrator(
+            calibration_file_path="/fake/path/cal.txt",
+            sample_rate=48000,
+            num_taps=64,
+            cache_strategy=NoOpFilterCache(),
+        )
+
+    calibrator._filter_taps = np.linspace(-1.0, 1.0, 63).astype(np.float32)
+    calibrator._reversed_taps = np.ascontiguousarray(calibrator._filter_taps[::-1])
+    signal = np.random.default_rng(0).standard_normal(3000, dtype=np.float32)
+
+    chunked = np.concatenate([calibrator.apply(chunk) for chunk in np.array_split(signal, 3)])
+    expected = lfilter(calibrator._filter_taps, 1.0, signal)
+
+    np.testing.assert_allclose(chunked, expected, atol=1e-4)
+
+
+def test_apply_direct_fir_matches_fft_path():
+    """
+    Verify that the direct-form kernel used for short filters matches the FFT path.
+    """
+    with patch("builtins.open", mock_open(read_data=DUMMY_CAL_DATA)):
+        direct = HardwareCalibrator("/fake/path/cal.txt", 48000, num_taps=64, cache_strategy=NoOpFilterCache())
+        fft = HardwareCalibrator("/fake/path/cal.txt", 48000, num_taps=64, cache_strategy=NoOpFilterCache())
+
+    signal = np.random.default_rng(1).standard_normal(2000, dtype=np.float32)
+
+    with patch("py_umik.hardware.calibrator.DIRECT_FIR_MAX_TAPS", 0):
+        expected = np.concatenate([fft.apply(chunk) for chunk in np.array_split(signal, 2)])
+    result = np.concatenate([direct.apply(chunk) for chunk in np.array_split(signal, 2)])
+
+    np.testing.assert_allclose(result, expected, atol=1e-4)
 
 
 def test_get_sensitivity_values_parsing():
@@ -139,3 +220,36 @@ def test_get_sensitivity_values_missing_header():
     with patch("builtins.open", mock_open(read_data=dummy_content)):
         with pytest.raises(ValueError, match="not found"):
             HardwareCalibrator.get_sensitivity_values("dummy.txt")
+
+
+def test_parse_frequency_response_skips_header_and_trailing_text():
+    """Verify that only the numeric table between header and trailing text is parsed."""
+    content = (
+        '* Comment line\n"Sens Factor" =-1.23dB\n\n10.0\t-5.0\n20.0 -2.5 0.0\n\n1000.0\t0.0\nEnd of data\n5.0 5.0\n'
+    )
+
+    with patch("builtins.open", mock_open(read_data=content)):
+        freqs, gains = HardwareCalibrator._parse_frequency_response("dummy.txt")
+
+    np.testing.assert_array_equal(freqs, [10.0, 20.0, 1000.0])
+    np.testing.assert_array_equal(gains, [-5.0, -2.5, 0.0])
+
+
+def test_parse_frequency_response_without_data_exits():
+    """Verify that a file with no frequency/gain pairs stops the application."""
+    with patch("builtins.open", mock_open(read_data='"Sens Factor" =-1.23dB\nno data\n')):
+        with pytest.raises(SystemExit):
+            HardwareCalibrator._parse_frequency_response("dummy.txt")
+
+
+def test_get_sensitivity_values_quoted_umik_header():
+    """Verify parsing of the quoted miniDSP header and rejection of a malformed one."""
+    settings.HARDWARE.NOMINAL_SENSITIVITY_DBFS = -18.0
+
+    with patch("builtins.open", mock_open(read_data='"Sens Factor" =-1.25dB, SERNO: 7000000\n10.0\t-5.0\n')):
+        sens_dbfs, _ = HardwareCalibrator.get_sensitivity_values("dummy.txt")
+    assert sens_dbfs == pytest.approx(-19.25)
+
+    with patch("builtins.open", mock_open(read_data='"Sens Factor" = n/a\n')):
+        with pytest.raises(ValueError, match="Could not parse"):
+            HardwareCalibrator.get_sensitivity_values("dummy.txt")
@@ -0,0 +1,69 @@
+"""
+Unit tests for the HardwareCalibratorAdapter class.
+
+Author: Daniel Collier
+GitHub: https://github.com/danielfcollier
+Year: 2025
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from py_umik.hardware.calibrator_adapter import HardwareCalibratorAdapter
+
+
+def test_calibrator_is_created_on_first_use_only():
+    """The factory is not called until audio is processed, and then only once."""
+    calibrator = MagicMock()
+    calibrator.apply.side_effect = lambda chunk: chunk
+    factory = MagicMock(return_value=calibrator)
+
+    adapter = HardwareCalibratorAdapter(factory)
+    factory.assert_not_called()
+
+    adapter.process_audio(np.zeros(4, dtype=np.float32))
+    adapter.process_audio(np.zeros(4, dtype=np.float32))
+
+    factory.assert_called_once_with()
+    assert calibrator.apply.call_count == 2
+
+
+def test_process_audio_casts_to_float32():
+    """Float64 input is handed to the calibrator as float32."""
+    calibrator = MagicMock()
+    calibrator.apply.side_effect = lambda chunk: chunk
+    adapter = HardwareCalibratorAdapter(lambda: calibrator)
+
+    result = adapter.process_audio(np.ones(4, dtype=np.float64))
+
+    assert result.dtype == np.float32
+
+
+def test_process_audio_batch_filters_rows_as_one_signal():
+    """A (chunks, block_size) batch is filtered in one call and keeps its shape."""
+    calibrator = MagicMock()
+    calibrator.apply.side_effect = lambda chunk: chunk * 2
+    adapter = HardwareCalibratorAdapter(lambda: calibrator)
+    batch = np.arange(6, dtype=np.float64).reshape(3, 2)
+
+    result = adapter.process_audio_batch(batch)
+
+    calibrator.apply.assert_called_once()
+    assert calibrator.apply.call_args[0][0].shape == (6,)
+    assert result.shape == (3, 2)
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, batch * 2)
+
+
+def test_factory_exit_is_raised_as_exception():
+    """A calibrator that exits while loading surfaces as an Exception the thread guard can catch."""
+
+    def failing_factory():
+        raise SystemExit(1)
+
+    adapter = HardwareCalibratorAdapter(failing_factory)
+
+    with pytest.raises(RuntimeError):
+        adapter.process_audio(np.zeros(4, dtype=np.float32))
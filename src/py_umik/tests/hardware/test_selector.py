@@ -76,6 +76,20 @@ def test_device_not_found_raises_exception(mock_sounddevice):
         HardwareSelector(target_id=99)
 
 
+def test_find_device_by_name_is_cached(mock_sounddevice):
+    """Test that device lookups are cached until the cache is invalidated."""
+    HardwareSelector.invalidate_device_cache()
+
+    assert HardwareSelector.find_device_by_name("umik") == 1
+    assert HardwareSelector.find_device_by_name("umik") == 1
+    mock_sounddevice.query_devices.assert_called_once()
+
+    HardwareSelector.invalidate_device_cache()
+    assert HardwareSelector.find_device_by_name("umik") == 1
+    assert mock_sounddevice.query_devices.call_count == 2
+    HardwareSelector.invalidate_device_cache()
+
+
 def test_show_audio_devices(mock_sounddevice):
     """Test the utility method that logs available devices."""
     with patch("py_umik.hardware.selector.logger") as mock_logger:
@@ -0,0 +1,25 @@
+"""
+Unit tests for the WAV reading helpers.
+
+Author: Daniel Collier
+GitHub: https://github.com/danielfcollier
+Year: 2025
+"""
+
+import numpy as np
+import soundfile as sf
+
+from py_umik.io.wav_reader import read_mono
+
+
+def test_read_mono_averages_channels_across_blocks(tmp_path):
+    """Test that a stereo file is mixed down to the mean of its channels, block by block."""
+    stereo = np.random.default_rng(0).uniform(-0.5, 0.5, (1000, 2)).astype(np.float32)
+    path = tmp_path / "stereo.wav"
+    sf.write(path, stereo, 48000, subtype="FLOAT")
+
+    with sf.SoundFile(path) as wav:
+        mono = read_mono(wav, block_frames=256)
+
+    assert mono.dtype == np.float32
+    np.testing.assert_allclose(mono, stereo.mean(axis=1), atol=1e-6)
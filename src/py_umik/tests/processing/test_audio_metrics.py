@@ -8,6 +8,7 @@ Year: 2025
 
 from unittest.mock import patch
 
+import librosa
 import numpy as np
 import pytest
 
@@ -37,18 +38,91 @@ def metrics():
 # ... (Existing tests for RMS, dBFS, dBSPL remain here) ...
 
 
+def test_rms_matches_numpy():
+    """Test that the compiled RMS kernel matches the NumPy definition for float32 and float64."""
+    audio = np.random.default_rng(1).uniform(-1.0, 1.0, 144_000)
+
+    for samples in (audio, audio.astype(np.float32)):
+        expected = np.sqrt(np.mean(samples.astype(np.float64) ** 2))
+        assert AudioMetrics.rms(samples) == pytest.approx(expected, rel=1e-9)
+
+    # Integer input is converted for the compiled kernel.
+    assert AudioMetrics.rms(np.array([3, 4, 3, 4])) == pytest.approx(np.sqrt(12.5))
+
+    # A (frames, 1) block is treated as the same mono signal.
+    assert AudioMetrics.rms(audio.reshape(-1, 1)) == pytest.approx(AudioMetrics.rms(audio))
+
+
+def test_dbfs_full_scale_sine():
+    """Test that a full-scale sine reads about -3 dBFS."""
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    sine = np.sin(2 * np.pi * 1000 * t).astype(np.float32)
+
+    assert AudioMetrics.dBFS(sine) == pytest.approx(-3.01, abs=0.01)
+
+
 def test_flux(metrics):
-    """Test that flux calls librosa and returns the max value."""
-    # Mock librosa to avoid actual DSP calculation
-    with patch("py_umik.processing.audio_metrics.librosa.onset.onset_strength") as mock_onset:
-        # Return a dummy envelope with a known max
-        mock_onset.return_value = np.array([0.1, 0.5, 0.2])
+    """Test that flux returns the peak of librosa's onset envelope."""
+    chunk = np.random.default_rng(3).uniform(-0.5, 0.5, 48000).astype(np.float32)
+
+    expected = np.max(librosa.onset.onset_strength(y=chunk, sr=SAMPLE_RATE))
+    result = metrics.flux(chunk, SAMPLE_RATE)
+
+    assert isinstance(result, float)
+    assert result == pytest.approx(expected, rel=1e-4)
+
+
+def test_flux_of_silence_is_zero(metrics):
+    """Test that a constant signal has no spectral flux."""
+    assert metrics.flux(np.zeros(4800, dtype=np.float32), SAMPLE_RATE) == 0.0
+
+
+def test_flux_series(metrics):
+    """Test that flux_series matches librosa's onset envelope reduced to the peak of each chunk."""
+    chunk_size = 4800
+    audio = np.random.default_rng(0).uniform(-0.5, 0.5, 10 * chunk_size).astype(np.float32)
+
+    onset_env = librosa.onset.onset_strength(y=audio, sr=SAMPLE_RATE, hop_length=512)
+    frame_chunks = np.minimum(np.arange(len(onset_env)) * 512 // chunk_size, 9)
+    expected = [onset_env[frame_chunks == i].max() for i in range(10)]
+
+    result = metrics.flux_series(audio, SAMPLE_RATE, chunk_size=chunk_size)
+
+    np.testing.assert_allclose(result, expected, rtol=1e-4)
 
-        chunk = np.zeros(1024)
-        result = metrics.flux(chunk, SAMPLE_RATE)
 
-        assert result == 0.5
-        mock_onset.assert_called_once()
+def test_k_weighting_matches_bs1770_coefficients():
+    """Test that the K-weighting SOS at 48 kHz reproduces the coefficients published in ITU-R BS.1770."""
+    sos = AudioMetrics(48000)._k_sos
+
+    np.testing.assert_allclose(
+        sos[0], [1.53512485958697, -2.69169618940638, 1.19839281085285, 1.0, -1.69065929318241, 0.73248077421585]
+    )
+    np.testing.assert_allclose(sos[1], [1.0, -2.0, 1.0, 1.0, -1.99004745483398, 0.99007225036621])
+
+
+def test_stream_energy_matches_numpy(metrics):
+    """Test that the fused pass returns the raw and K-weighted energy of float32 chunks."""
+    audio = np.random.default_rng(4).uniform(-0.5, 0.5, SAMPLE_RATE).astype(np.float32)
+
+    energies = [metrics.stream_energy(chunk) for chunk in np.array_split(audio, 5)]
+    sum_squares = sum(e[0] for e in energies)
+    k_sum_squares = sum(e[1] for e in energies)
+
+    assert sum_squares == pytest.approx(np.sum(audio.astype(np.float64) ** 2), rel=1e-9)
+    assert k_sum_squares == pytest.approx(np.sum(metrics.k_weighting(audio.astype(np.float64)) ** 2), rel=1e-9)
+
+
+def test_mean_square_to_lufs_scalar_and_array():
+    """Test that a scalar mean square gives a float and an array gives an array, both gated."""
+    lufs = AudioMetrics.mean_square_to_lufs(0.01)
+    assert type(lufs) is float
+    assert lufs == pytest.approx(-20.691)
+    assert AudioMetrics.mean_square_to_lufs(0.0) == settings.METRICS.LUFS_LOWER_BOUND
+
+    series = AudioMetrics.mean_square_to_lufs(np.array([0.01, 0.0]))
+    assert isinstance(series, np.ndarray)
+    np.testing.assert_allclose(series, [-20.691, settings.METRICS.LUFS_LOWER_BOUND])
 
 
 def test_lufs_aggregation(metrics):
@@ -61,16 +135,27 @@ def test_lufs_aggregation(metrics):
     metrics.aggregate_lufs_chunks(chunk2)
 
     # 2. Verify internal state (white-box testing)
-    assert len(metrics._lufs_chunks) == 2
+    assert metrics._lufs_write_index == 4
 
-    # 3. Retrieve chunks
+    # 3. Retrieve the contiguous samples
     retrieved = metrics.get_lufs_chunks()
 
     # 4. Verify retrieval and clearing
-    assert len(retrieved) == 2
-    assert np.array_equal(retrieved[0], chunk1)
-    assert np.array_equal(retrieved[1], chunk2)
-    assert len(metrics._lufs_chunks) == 0  # Should be cleared
+    assert retrieved.dtype == np.float32
+    assert np.shares_memory(retrieved, metrics._lufs_buffer)  # A view, not a copy
+    np.testing.assert_allclose(retrieved, [0.1, 0.2, 0.3, 0.4], rtol=1e-6)
+    assert metrics._lufs_write_index == 0  # Should be cleared
+    assert len(metrics.get_lufs_chunks()) == 0
+
+
+def test_lufs_aggregation_grows_past_window(metrics):
+    """Test that aggregating more than one LUFS window keeps every sample."""
+    audio = np.random.default_rng(2).uniform(-1.0, 1.0, 3 * metrics._lufs_block_size).astype(np.float32)
+
+    for chunk in np.split(audio, 6):
+        metrics.aggregate_lufs_chunks(chunk)
+
+    np.testing.assert_array_equal(metrics.get_lufs_chunks(), audio)
 
 
 def test_show_metrics(metrics):
@@ -87,3 +172,14 @@ def test_show_metrics(metrics):
         assert "0.1235" in log_message  # Rounded up
         assert "-20.5000" in log_message
         assert "measured_at: 12:00:00" in log_message
+
+
+def test_show_metrics_skipped_when_info_disabled(metrics):
+    """Test that nothing is formatted or logged when INFO is disabled."""
+    with patch("py_umik.processing.audio_metrics.logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = False
+
+        assert not metrics.metrics_logging_enabled()
+        metrics.show_metrics(measured_at="12:00:00", rms=0.123456)
+
+        mock_logger.info.assert_not_called()
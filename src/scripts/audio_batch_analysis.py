@@ -12,16 +12,17 @@ Year: 2025
 """
 
 import argparse
-import csv
 import glob
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
-import numpy as np
-from scipy.io import wavfile
+import soundfile as sf
 
+from src.py_umik.apps.metrics_analyzer import compute_metric_columns, format_csv_rows
 from src.py_umik.hardware.calibrator import HardwareCalibrator
+from src.py_umik.io.wav_reader import read_mono
 from src.py_umik.processing.audio_metrics import AudioMetrics
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S")
@@ -32,33 +33,71 @@ def load_and_normalize_wav(file_path):
     """
     Loads a WAV file and converts it to a normalized float32 format.
 
-    Handles bit-depth conversion (int16/int32 to -1.0..1.0 float) and
-    mixes stereo files down to mono for consistent analysis.
+    libsndfile handles the bit-depth conversion (int16/int32 to -1.0..1.0 float)
+    while decoding, and stereo files are mixed down to mono for consistent analysis.
 
     :param file_path: The absolute or relative path to the .wav file.
     :return: A tuple containing (sample_rate, audio_data_array). Returns (None, None) on failure.
     """
     try:
-        sample_rate, data = wavfile.read(file_path)
+        with sf.SoundFile(file_path) as wav:
+            sample_rate = wav.samplerate
+            data = wav.read(dtype="float32") if wav.channels == 1 else read_mono(wav)
     except Exception as e:
         logger.error(f"Failed to read {file_path}: {e}")
         return None, None
 
-    if len(data.shape) > 1:
-        data = np.mean(data, axis=1)
+    return sample_rate, data
 
-    if data.dtype == np.int16:
-        data = data.astype(np.float32) / 32768.0
-    elif data.dtype == np.int32:
-        data = data.astype(np.float32) / 2147483648.0
 
-    return sample_rate, data
+def analyze_file(file_path, chunk_ms, sensitivity, reference):
+    """
+    Calculates the time-series metrics of a single WAV file.
+
+    Runs in a worker process, so every file is loaded and analyzed
+    independently of the others. The metrics come from the same vectorized
+    pass as the single-file analyzer (`compute_metric_columns`), so both
+    tools report identical numbers for the same file.
+
+    :param file_path: Path of the .wav file to analyze.
+    :param chunk_ms: The size of each analysis window in milliseconds.
+    :param sensitivity: The microphone sensitivity in dBFS (optional, for dBSPL).
+    :param reference: The reference pressure level in dB (default 94.0).
+    :return: A list of formatted CSV lines (empty if the file was skipped).
+    """
+    filename = os.path.basename(file_path)
 
+    sample_rate, full_audio = load_and_normalize_wav(file_path)
+    if full_audio is None:
+        return []
 
-def process_directory(input_dir, output_csv, chunk_ms, sensitivity, reference):
+    chunk_size = int(sample_rate * (chunk_ms / 1000))
+    total_chunks = len(full_audio) // chunk_size if chunk_size else 0
+
+    if total_chunks == 0:
+        logger.warning(f"Skipping {filename}: Audio shorter than {chunk_ms}ms")
+        return []
+
+    try:
+        metrics_engine = AudioMetrics(sample_rate=sample_rate)
+        metrics = compute_metric_columns(metrics_engine, full_audio, sample_rate, chunk_size, sensitivity, reference)
+    except Exception as e:
+        logger.warning(f"Math error in {filename}: {e}")
+        return []
+
+    # Quote the filename the way csv.writer would if it contains a delimiter or quote.
+    if any(c in filename for c in ',"\r\n'):
+        filename = '"' + filename.replace('"', '""') + '"'
+
+    return format_csv_rows({"filename": [filename] * total_chunks, **metrics})
+
+
+def process_directory(input_dir, output_csv, chunk_ms, sensitivity, reference, workers=None):
     """
-    Iterates through all WAV files in a directory and generates a combined metrics CSV.
+    Analyzes all WAV files in a directory in parallel and generates a combined metrics CSV.
 
+    Files are independent of each other, so each one is handed to a worker
+    process; results are written back in sorted filename order.
     Applies sliding window logic for LUFS calculation and uses calibration data
     (if provided) to compute real-world dBSPL.
 
@@ -67,6 +106,7 @@ def process_directory(input_dir, output_csv, chunk_ms, sensitivity, reference):
     :param chunk_ms: The size of each analysis window in milliseconds.
     :param sensitivity: The microphone sensitivity in dBFS (optional, for dBSPL).
     :param reference: The reference pressure level in dB (default 94.0).
+    :param workers: Number of worker processes (defaults to the CPU count).
     """
     wav_files = sorted(glob.glob(os.path.join(input_dir, "*.wav")))
     if not wav_files:
@@ -79,76 +119,19 @@ def process_directory(input_dir, output_csv, chunk_ms, sensitivity, reference):
 
     fieldnames = ["filename", "time_sec", "rms", "dbfs", "lufs", "flux", "dbspl"]
 
-    with open(output_csv, mode="w", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for file_idx, file_path in enumerate(wav_files):
-            filename = os.path.basename(file_path)
-            logger.info(f"[{file_idx + 1}/{len(wav_files)}] Processing {filename}...")
-
-            sample_rate, full_audio = load_and_normalize_wav(file_path)
-            if full_audio is None:
-                continue
-
-            metrics_engine = AudioMetrics(sample_rate=sample_rate)
-            chunk_size = int(sample_rate * (chunk_ms / 1000))
-            total_chunks = len(full_audio) // chunk_size
-
-            # LUFS Window Calculation (Updated to 1.0s for stability)
-            lufs_window_size = int(sample_rate * 1.0)
-
-            if total_chunks == 0:
-                logger.warning(f"Skipping {filename}: Audio shorter than {chunk_ms}ms")
-                continue
-
-            rows = []
-            for i in range(total_chunks):
-                start = i * chunk_size
-                end = start + chunk_size
-                chunk = full_audio[start:end]
-                timestamp = end / sample_rate
-
-                try:
-                    rms = metrics_engine.rms(chunk)
-                    dbfs = metrics_engine.dBFS(chunk)
-                    flux = metrics_engine.flux(chunk, sample_rate)
-
-                    # Sliding Window for LUFS
-                    # Look back 1 second to calculate "Momentary" loudness
-                    lufs_start = max(0, end - lufs_window_size)
-                    lufs_chunk = full_audio[lufs_start:end]
-
-                    try:
-                        # Only calculate if we have enough data (at least 400ms is required by spec,
-                        # we use 40% of our 1s window)
-                        if len(lufs_chunk) >= lufs_window_size * 0.4:
-                            lufs = metrics_engine.lufs(lufs_chunk)
-                        else:
-                            lufs = -70.0  # Not enough history
-                    except ValueError:
-                        lufs = -70.0
-
-                    dbspl = None
-                    if sensitivity is not None:
-                        dbspl = metrics_engine.dBSPL(dbfs, sensitivity, reference)
-
-                    rows.append(
-                        {
-                            "filename": filename,
-                            "time_sec": round(timestamp, 3),
-                            "rms": round(rms, 6),
-                            "dbfs": round(dbfs, 2),
-                            "lufs": round(lufs, 2),
-                            "flux": round(flux, 2),
-                            "dbspl": round(dbspl, 2) if dbspl is not None else "",
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"Math error in {filename} at chunk {i}: {e}")
-
-            writer.writerows(rows)
-            csvfile.flush()
+    # A 1 MiB buffer turns the output into a handful of large syscalls.
+    with (
+        open(output_csv, mode="w", newline="", buffering=1 << 20) as csvfile,
+        ProcessPoolExecutor(max_workers=workers) as executor,
+    ):
+        csvfile.write(",".join(fieldnames) + "\r\n")
+
+        n = len(wav_files)
+        results = executor.map(analyze_file, wav_files, [chunk_ms] * n, [sensitivity] * n, [reference] * n)
+        for file_idx, (file_path, rows) in enumerate(zip(wav_files, results, strict=True)):
+            logger.info(f"[{file_idx + 1}/{n}] Processed {os.path.basename(file_path)}")
+            if rows:
+                csvfile.write("\r\n".join(rows) + "\r\n")
 
     logger.info(f"✅ Batch analysis complete. Data saved to {output_csv}")
 
@@ -159,6 +142,7 @@ if __name__ == "__main__":
     parser.add_argument("--window", type=int, default=100, help="Window size in ms (default: 100)")
     parser.add_argument("--calibration-file", "-F", help="Path to UMIK-1 calibration file (.txt)")
     parser.add_argument("--output-file", "-o", help="Optional path for output CSV")
+    parser.add_argument("--workers", "-j", type=int, help="Number of worker processes (default: CPU count)")
 
     args = parser.parse_args()
 
@@ -176,4 +160,4 @@ if __name__ == "__main__":
     else:
         out_csv = os.path.join(args.input_dir, "batch_metrics.csv")
 
-    process_directory(args.input_dir, out_csv, args.window, sens, ref)
+    process_directory(args.input_dir, out_csv, args.window, sens, ref, args.workers)